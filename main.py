@@ -1,22 +1,96 @@
-from crewai import Agent, Crew, Process, Task, LLM
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 from dotenv import load_dotenv
 import os
-import requests
 import time
 import json
-import base64
+import asyncio
+import aiofiles
+import httpx
+import functools
+import hashlib
+import importlib.util
+import re
+from collections import deque
 from datetime import datetime
 
+# CrewAI and the optional semantic cache dependencies are heavy (pydantic, litellm,
+# torch...), so they are imported on first use rather than at module load.
+# Optional semantic cache dependencies: pip install sentence-transformers faiss-cpu
+SEMANTIC_CACHE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("faiss", "sentence_transformers")
+)
+
 load_dotenv()
 
+# Top-level section headers the agent is asked to produce; models often add a suffix
+# ("# BLOG POST: <title>", "# BLOG POST (1200 words)"), which is allowed and dropped
+_SECTION_RE = re.compile(r'^# (BLOG POST|LINKEDIN POSTS|X/TWITTER POSTS|IMAGE CONCEPTS)(?:[ \t:(\-—].*)?$', re.MULTILINE)
+_SECTION_KEYS = {
+    "BLOG POST": "blog",
+    "LINKEDIN POSTS": "linkedin",
+    "X/TWITTER POSTS": "twitter",
+    "IMAGE CONCEPTS": "images"
+}
+
+# Characters not allowed in output directory names (keeps letters, digits, space, '-' and '_')
+_BAD_RE = re.compile(r'[^\w \-]')
+
 # Simple, reliable LLM configuration
-llm = LLM(
-    model="groq/deepseek-r1-distill-llama-70b",
-    api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.6,
-    max_tokens=2500  # Reduced token limit for stability
-)
+LLM_MODEL = "groq/deepseek-r1-distill-llama-70b"
+LLM_TEMPERATURE = 0.6
+LLM_MAX_TOKENS = 2500  # Reduced token limit for stability
+
+@functools.lru_cache(maxsize=None)
+def get_llm():
+    """Build the shared LLM on first use"""
+    from crewai import LLM
+    return LLM(
+        model=LLM_MODEL,
+        api_key=os.getenv("GROQ_API_KEY"),
+        temperature=LLM_TEMPERATURE,
+        max_tokens=LLM_MAX_TOKENS
+    )
+
+def parse_sections(content_str: str) -> dict:
+    """Split agent output into {'blog', 'linkedin', 'twitter', 'images'} in a single scan"""
+    matches = list(_SECTION_RE.finditer(content_str))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content_str)
+        # Keep the first occurrence if the model repeats a header
+        sections.setdefault(_SECTION_KEYS[match.group(1)], content_str[match.end():end].strip())
+    return sections
+
+# Agent system prompt - kept free of the topic so it is a byte-identical prefix on
+# every run and the provider's prompt cache can reuse it. The topic only appears
+# in the task description (the suffix).
+CONTENT_CREATOR_ROLE = "Senior Content Writer & Researcher"
+CONTENT_CREATOR_GOAL = "Create comprehensive blog posts (800-1200 words) for Medium.com, backed by thorough research, plus social media adaptations in English and Turkish."
+CONTENT_CREATOR_BACKSTORY = "You are a senior content writer specializing in creating in-depth, well-researched blog posts for Medium.com. You excel at turning complex topics into engaging, accessible articles that provide real value to readers. You conduct thorough research using web search and create comprehensive content that serves as the foundation for all other marketing materials. You also adapt content for social media in both English and Turkish."
+PROMPT_PREFIX_HASH = hashlib.sha256(
+    "\n".join([CONTENT_CREATOR_ROLE, CONTENT_CREATOR_GOAL, CONTENT_CREATOR_BACKSTORY]).encode("utf-8")
+).hexdigest()[:16]
+
+class RateLimiter:
+    """Sliding-window rate limiter - only waits when the call budget is actually exhausted"""
+    
+    def __init__(self, max_calls_per_min: int):
+        self.max_calls = max_calls_per_min
+        self.period = 60.0
+        self.calls = deque()
+    
+    async def acquire(self):
+        """Wait until a call slot is free, then claim it"""
+        while True:
+            now = time.monotonic()
+            # Drop timestamps that have left the window
+            while self.calls and now - self.calls[0] >= self.period:
+                self.calls.popleft()
+            
+            if len(self.calls) < self.max_calls:
+                self.calls.append(now)
+                return
+            
+            await asyncio.sleep(self.period - (now - self.calls[0]))
 
 class ImageGenerator:
     """Custom tool for generating images using Stability AI API"""
@@ -24,13 +98,20 @@ class ImageGenerator:
     def __init__(self):
         self.stability_api_key = os.getenv("STABILITY_API_KEY")
         self.api_url = "https://api.stability.ai/v2beta/stable-image/generate/sd3"
+        self.rate_limiter = RateLimiter(max_calls_per_min=60)
     
-    def generate_image(self, prompt: str, output_dir: str = "generated_images") -> str:
+    async def generate_image_async(self, client: httpx.AsyncClient, prompt: str, output_dir: str = "generated_images") -> str:
         """Generate image using Stability AI Stable Diffusion 3.5"""
         try:
             # Create output directory if it doesn't exist
             os.makedirs(output_dir, exist_ok=True)
             
+            # Stable, collision-resistant filename so repeated prompts hit the file cache
+            fname_hash = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+            filename = f"{output_dir}/stability_image_{fname_hash}.png"
+            if os.path.exists(filename):
+                return f"✅ cached: {filename}"
+            
             print(f"🎨 Generating image with Stability AI: {prompt[:50]}...")
             
             # Prepare headers
@@ -47,42 +128,110 @@ class ImageGenerator:
                 "output_format": "png"
             }
             
-            # Make API request
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                files={"none": ""},
-                data=data
-            )
-            
-            if response.status_code == 200:
-                # Generate filename
-                filename = f"{output_dir}/stability_image_{hash(prompt) % 10000}.png"
-                
-                # Save the image
-                with open(filename, 'wb') as f:
-                    f.write(response.content)
-                
-                return f"✅ Stability AI image saved: {filename}"
-            else:
-                return f"❌ Stability AI error: {response.status_code} - {response.text}"
+            # Make API request (waits only if the per-minute budget is used up)
+            await self.rate_limiter.acquire()
+            async with client.stream("POST", self.api_url, headers=headers, files={"none": ""}, data=data) as response:
+                if response.status_code == 200:
+                    # Stream the image to disk in 64 KiB chunks instead of buffering it in memory.
+                    # The default buffered writer always writes each chunk in full (a raw unbuffered
+                    # file may do short writes). Write to a .part file and rename once complete:
+                    # a truncated PNG at the final path would be served as a cache hit forever
+                    part_filename = filename + ".part"
+                    try:
+                        async with aiofiles.open(part_filename, 'wb') as f:
+                            async for chunk in response.aiter_bytes(65536):
+                                await f.write(chunk)
+                        os.replace(part_filename, filename)
+                    except BaseException:  # includes cancellation
+                        if os.path.exists(part_filename):
+                            os.remove(part_filename)
+                        raise
+                    
+                    return f"✅ Stability AI image saved: {filename}"
+                else:
+                    await response.aread()
+                    return f"❌ Stability AI error: {response.status_code} - {response.text}"
                 
         except Exception as e:
             return f"❌ Error generating Stability AI image: {str(e)}"
 
+class SemanticCache:
+    """Semantic cache for generated content packages, keyed by topic embedding"""
+    
+    def __init__(self, model_name, temperature, prompt_hash="", cache_dir="cache", embedding_model="all-MiniLM-L6-v2"):
+        # Separate cache per (model, temperature, prompt prefix) so neither a model
+        # change nor a prompt edit can serve stale content
+        cache_key = hashlib.sha256(f"{model_name}|{temperature}|{prompt_hash}".encode("utf-8")).hexdigest()[:16]
+        self.cache_dir = os.path.join(cache_dir, cache_key)
+        self.index_path = os.path.join(self.cache_dir, "topics.faiss")
+        self.entries_path = os.path.join(self.cache_dir, "entries.json")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        import faiss
+        from sentence_transformers import SentenceTransformer
+        self.faiss = faiss
+        self.encoder = SentenceTransformer(embedding_model)
+        
+        # Load persisted index + side table, or start fresh
+        if os.path.exists(self.index_path) and os.path.exists(self.entries_path):
+            self.index = self.faiss.read_index(self.index_path)
+            with open(self.entries_path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        else:
+            # Inner product over normalized vectors == cosine similarity
+            self.index = self.faiss.IndexFlatIP(self.encoder.get_sentence_embedding_dimension())
+            self.entries = []
+    
+    def embed(self, topic):
+        """Embed a topic as a normalized float32 row vector"""
+        return self.encoder.encode([topic], normalize_embeddings=True, convert_to_numpy=True).astype("float32")
+    
+    def lookup(self, topic, threshold=0.92):
+        """Return (cached_entry or None, topic_embedding)"""
+        embedding = self.embed(topic)
+        if self.index.ntotal == 0:
+            return None, embedding
+        
+        scores, ids = self.index.search(embedding, 1)
+        if ids[0][0] != -1 and scores[0][0] >= threshold:
+            entry = self.entries[ids[0][0]]
+            print(f"⚡ Semantic cache hit ({scores[0][0]:.3f}): '{entry['topic']}'")
+            return entry, embedding
+        return None, embedding
+    
+    def store(self, topic, embedding, result, image_paths):
+        """Store a generated content package and persist the cache to disk"""
+        self.index.add(embedding)
+        self.entries.append({
+            "topic": topic,
+            "content": str(result),
+            "images": list(image_paths),
+            "created": datetime.now().isoformat()
+        })
+        
+        self.faiss.write_index(self.index, self.index_path)
+        with open(self.entries_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+
 class SimpleSocialCreator:
     """Single-agent social media content creator - more reliable!"""
     
     def __init__(self):
+        from crewai import Agent
+        from crewai_tools import SerperDevTool, ScrapeWebsiteTool
+        
         self.image_generator = ImageGenerator()
         
+        # Semantic cache for near-duplicate topics (disabled if deps are missing)
+        self.cache = SemanticCache(LLM_MODEL, LLM_TEMPERATURE, PROMPT_PREFIX_HASH) if SEMANTIC_CACHE_AVAILABLE else None
+        
         # Single agent that does everything - BLOG FOCUSED
         self.content_creator = Agent(
-            role="Senior Content Writer & Researcher",
-            goal="Create comprehensive blog posts (800-1200 words) for Medium.com about '{topic}', backed by thorough research, plus social media adaptations in English and Turkish.",
-            backstory="You are a senior content writer specializing in creating in-depth, well-researched blog posts for Medium.com. You excel at turning complex topics into engaging, accessible articles that provide real value to readers. You conduct thorough research using web search and create comprehensive content that serves as the foundation for all other marketing materials. You also adapt content for social media in both English and Turkish.",
+            role=CONTENT_CREATOR_ROLE,
+            goal=CONTENT_CREATOR_GOAL,
+            backstory=CONTENT_CREATOR_BACKSTORY,
             tools=[SerperDevTool(), ScrapeWebsiteTool()],
-            llm=llm,
+            llm=get_llm(),
             verbose=True,
             max_iter=2,  # Keep it simple
             max_rpm=3    # Conservative rate limiting
@@ -90,6 +239,7 @@ class SimpleSocialCreator:
 
     def create_complete_content(self, topic):
         """Single task that creates all content - BLOG FIRST approach"""
+        from crewai import Task
         
         task = Task(
             description=f"""
@@ -156,73 +306,104 @@ class SimpleSocialCreator:
         
         return task
 
-    def save_content_to_files(self, topic, content, images):
+    @staticmethod
+    async def _write_file_async(path, text):
+        """Write a text file via aiofiles' thread pool so the event loop isn't blocked"""
+        async with aiofiles.open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            await f.write(text)
+
+    async def save_content_to_files_async(self, topic, content, images):
         """Save all content to organized files"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+        # Resolve timestamp and content string once for all files
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        ts_str = now.strftime('%Y-%m-%d %H:%M:%S')
+        content_str = str(content)
+        
+        safe_topic = _BAD_RE.sub('', topic).rstrip()[:50]
         output_dir = f"outputs/{safe_topic}_{timestamp}"
-        os.makedirs(output_dir, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
         
         print(f"\n💾 Saving content to: {output_dir}")
+        files = {}
         
-        # Save complete content with better blog extraction
-        with open(f"{output_dir}/01_BLOG_POST_MEDIUM.md", "w", encoding="utf-8") as f:
-            f.write(f"# {topic}\n\n")
-            f.write(f"*Ready for Medium.com - Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            
-            # Try to extract blog section from content
-            content_str = str(content)
-            if "# BLOG POST" in content_str:
-                blog_start = content_str.find("# BLOG POST") + len("# BLOG POST")
-                blog_end = content_str.find("# LINKEDIN POSTS")
-                if blog_end == -1:
-                    blog_end = content_str.find("# X/TWITTER POSTS") 
-                if blog_end == -1:
-                    blog_end = len(content_str)
-                blog_content = content_str[blog_start:blog_end].strip()
-                f.write(blog_content)
-            else:
-                f.write("⚠️ Blog content extraction failed. Check complete_content.md for full output.\n\n")
-                f.write(str(content))
+        # Split the output into sections in one pass
+        sections = parse_sections(content_str)
+        
+        # Save blog post
+        parts = [f"# {topic}\n\n", f"*Ready for Medium.com - Generated on: {ts_str}*\n\n"]
+        if sections.get("blog"):
+            parts.append(sections["blog"])
+        else:
+            parts.append("⚠️ Blog content extraction failed. Check complete_content.md for full output.\n\n")
+            parts.append(content_str)
+        
+        files[f"{output_dir}/01_BLOG_POST_MEDIUM.md"] = "".join(parts)
+        
+        # Save social media and image concept sections to their own files
+        section_files = [
+            ("linkedin", "02_LINKEDIN_POSTS.md", "LinkedIn Posts"),
+            ("twitter", "03_TWITTER_POSTS.md", "X/Twitter Posts"),
+            ("images", "04_IMAGE_CONCEPTS.md", "Image Concepts")
+        ]
+        saved_sections = []
+        for key, filename, title in section_files:
+            if sections.get(key):
+                files[f"{output_dir}/{filename}"] = f"# {title}: {topic}\n\n*Generated on: {ts_str}*\n\n{sections[key]}"
+                saved_sections.append((filename, title))
         
         # Save complete content
-        with open(f"{output_dir}/complete_content.md", "w", encoding="utf-8") as f:
-            f.write(f"# Complete Content Package: {topic}\n\n")
-            f.write(f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            f.write(str(content))
+        parts = [
+            f"# Complete Content Package: {topic}\n\n",
+            f"**Generated on:** {ts_str}\n\n",
+            "---\n\n",
+            content_str
+        ]
+        files[f"{output_dir}/complete_content.md"] = "".join(parts)
         
         # Save image info
-        with open(f"{output_dir}/images_generated.txt", "w", encoding="utf-8") as f:
-            f.write(f"GENERATED IMAGES - {topic}\n")
-            f.write("="*50 + "\n\n")
-            for i, img_result in enumerate(images, 1):
-                f.write(f"Image {i}:\n{img_result}\n\n")
+        parts = [f"GENERATED IMAGES - {topic}\n", "="*50 + "\n\n"]
+        parts.extend(f"Image {i}:\n{img_result}\n\n" for i, img_result in enumerate(images, 1))
+        files[f"{output_dir}/images_generated.txt"] = "".join(parts)
         
         # Create README
-        with open(f"{output_dir}/README.md", "w", encoding="utf-8") as f:
-            f.write(f"# Content Package: {topic}\n\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("## 📁 Files:\n\n")
-            f.write("- `01_BLOG_POST_MEDIUM.md` - **MAIN BLOG POST** (800-1200 words for Medium.com)\n")
-            f.write("- `complete_content.md` - All content in one file\n")
-            f.write("- `images_generated.txt` - Image generation results\n")
-            f.write("- `generated_images/` - Actual image files\n\n")
-            f.write("## 🎯 Priority Content:\n\n")
-            f.write("🔥 **MAIN DELIVERABLE**: `01_BLOG_POST_MEDIUM.md`\n\n")
-            f.write("📱 **Social Media**: Check `complete_content.md` for LinkedIn & Twitter posts\n\n")
-            f.write("## 📊 What's included:\n\n")
-            f.write("✅ Comprehensive blog post (800-1200 words) - READY FOR MEDIUM\n")
-            f.write("✅ LinkedIn posts (English + Turkish)\n")
-            f.write("✅ X/Twitter posts (English + Turkish)\n")
-            f.write("✅ AI-generated images\n")
-            f.write("✅ Research-backed content with current data\n")
+        parts = [
+            f"# Content Package: {topic}\n\n",
+            f"Generated on: {ts_str}\n\n",
+            "## 📁 Files:\n\n",
+            "- `01_BLOG_POST_MEDIUM.md` - **MAIN BLOG POST** (800-1200 words for Medium.com)\n",
+            *(f"- `{filename}` - {title}\n" for filename, title in saved_sections),
+            "- `complete_content.md` - All content in one file\n",
+            "- `images_generated.txt` - Image generation results\n",
+            "- `generated_images/` - Actual image files\n\n",
+            "## 🎯 Priority Content:\n\n",
+            "🔥 **MAIN DELIVERABLE**: `01_BLOG_POST_MEDIUM.md`\n\n",
+            (
+                "📱 **Social Media**: " + ", ".join(f"`{filename}`" for filename, _ in saved_sections) + "\n\n"
+                if saved_sections else
+                "📱 **Social Media**: Sections could not be split out; check `complete_content.md`\n\n"
+            ),
+            "## 📊 What's included:\n\n",
+            "✅ Comprehensive blog post (800-1200 words) - READY FOR MEDIUM\n",
+            "✅ LinkedIn posts (English + Turkish)\n",
+            "✅ X/Twitter posts (English + Turkish)\n",
+            "✅ AI-generated images\n",
+            "✅ Research-backed content with current data\n"
+        ]
+        files[f"{output_dir}/README.md"] = "".join(parts)
+        
+        # Write all files concurrently
+        await asyncio.gather(*(self._write_file_async(path, text) for path, text in files.items()))
         
         return output_dir
 
-    def generate_images(self, topic):
-        """Generate images for the content using Stability AI"""
+    def save_content_to_files(self, topic, content, images):
+        """Synchronous entry point for saving content"""
+        return asyncio.run(self.save_content_to_files_async(topic, content, images))
+
+    async def generate_images_async(self, topic):
+        """Generate images for the content using Stability AI (concurrently)"""
         
         print("\n🎨 Generating images with Stability AI...")
         
@@ -232,55 +413,68 @@ class SimpleSocialCreator:
             f"Social media post graphic about {topic}, engaging visual design, vibrant colors, professional illustration, marketing style"
         ]
         
-        results = []
-        for i, prompt in enumerate(prompts, 1):
-            print(f"\n🖼️  Generating Stability AI image {i}/{len(prompts)}...")
-            result = self.image_generator.generate_image(prompt)
-            results.append(result)
-            
-            # Delay between generations (Stability AI rate limits)
-            if i < len(prompts):
-                print("⏱️  Waiting 3 seconds...")
-                time.sleep(3)
+        print(f"🖼️  Generating {len(prompts)} Stability AI images in parallel...")
+        
+        # Fire all requests at once - Stability's per-key rate limiter handles concurrency.
+        # With HTTP/2 both requests are multiplexed over one TCP connection and TLS session.
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+        async with httpx.AsyncClient(http2=True, timeout=60, limits=limits) as client:
+            results = await asyncio.gather(
+                *(self.image_generator.generate_image_async(client, prompt) for prompt in prompts)
+            )
         
-        return results
+        return list(results)
 
-    def create_content(self, topic):
-        """Main function to create all content"""
+    def generate_images(self, topic):
+        """Synchronous entry point for image generation"""
+        return asyncio.run(self.generate_images_async(topic))
+
+    async def create_content_async(self, topic):
+        """Create all content, running the LLM crew and image generation concurrently"""
+        from crewai import Crew, Process
         
         print(f"\n🚀 Creating content for: '{topic}'")
         print("🔄 Using simplified single-agent approach...")
         print("="*60)
         
         try:
-            # Create the task
-            task = self.create_complete_content(topic)
-            
-            # Create simple crew with one agent and one task
-            crew = Crew(
-                agents=[self.content_creator],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=True,
-                max_rpm=2  # Very conservative
-            )
-            
-            # Execute content creation
-            print("⏱️  Starting content creation...")
-            time.sleep(2)  # Initial delay
+            # Check the semantic cache before running the crew
+            cached, embedding = self.cache.lookup(topic) if self.cache else (None, None)
             
-            result = crew.kickoff(inputs={"topic": topic})
-            
-            print("\n✅ Content creation completed!")
-            
-            # Generate images
-            print("\n⏱️  Waiting 5 seconds before image generation...")
-            time.sleep(5)
-            
-            images = self.generate_images(topic)
+            if cached:
+                result = content_str = cached["content"]
+                images = cached["images"]
+            else:
+                # Create the task
+                task = self.create_complete_content(topic)
+                
+                # Create simple crew with one agent and one task
+                crew = Crew(
+                    agents=[self.content_creator],
+                    tasks=[task],
+                    process=Process.sequential,
+                    verbose=True,
+                    max_rpm=2  # Very conservative
+                )
+                
+                # Image prompts only depend on the topic, so generate them while the crew runs
+                # (Groq calls are rate limited by the crew's max_rpm)
+                print("⏱️  Starting content creation and image generation...")
+                result, images = await asyncio.gather(
+                    asyncio.to_thread(crew.kickoff, inputs={"topic": topic}),
+                    self.generate_images_async(topic)
+                )
+                
+                print("\n✅ Content creation completed!")
+                
+                # Stringify the CrewOutput once; cache and file writer both reuse it
+                content_str = str(result)
+                
+                if self.cache:
+                    self.cache.store(topic, embedding, content_str, images)
             
             # Save everything
-            output_dir = self.save_content_to_files(topic, result, images)
+            output_dir = await self.save_content_to_files_async(topic, content_str, images)
             
             return {
                 "content": result,
@@ -293,6 +487,10 @@ class SimpleSocialCreator:
             print("💡 Try again in a few minutes or check your API keys")
             raise e
 
+    def create_content(self, topic):
+        """Main function to create all content"""
+        return asyncio.run(self.create_content_async(topic))
+
 # Usage
 if __name__ == "__main__":
     # Create simple content creator
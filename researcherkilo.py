@@ -4,13 +4,108 @@ from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 from dotenv import load_dotenv
 import os
 import re
+import json
+import asyncio
+import logging
+import time
+import queue
+import zlib
+import sqlite3
+import hashlib
+import importlib.util
+import pathlib
+import functools
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Type
-from pydantic import BaseModel, Field
+from typing import List, Optional, Type
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Optional semantic LLM cache dependencies: pip install sentence-transformers (+ faiss-cpu or numba).
+# Probed, not imported: torch, faiss and numba/llvmlite load on the first cached LLM call
+SEMANTIC_CACHE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("numpy", "sentence_transformers")
+)
+FAISS_AVAILABLE = importlib.util.find_spec("faiss") is not None
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 load_dotenv()
 
+# Progress logging; level is set from the VERBOSE flag when the creator is built.
+# No handler here: the __main__ block (or the importing app) configures output
+logger = logging.getLogger(__name__)
+
+# API keys are resolved once at import; MultiAgentContentCreator refuses to start without them
+_SERPER_KEY = os.getenv("SERPER_API_KEY")
+_GROQ_KEY = os.getenv("GROQ_API_KEY")
+
+# Serper.dev API endpoint for Google Scholar
+SCHOLAR_URL = "https://google.serper.dev/scholar"
+SCHOLAR_HEADERS = {
+    'X-API-KEY': _SERPER_KEY or "",
+    'Content-Type': 'application/json'
+}
+
+# Transient Serper.dev statuses retried inside the tool instead of by the agent's LLM loop
+RETRYABLE_STATUS = (429, 502, 503, 504)
+
+class RetryableStatusError(requests.RequestException):
+    """Serper.dev answered with a transient error status"""
+
+# Publication year in Scholar snippets (common format: "- 2023 - ...")
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# Deletion table for output folder names: drop Latin-1 punctuation/control chars in one C-level pass
+_SLUG_TRANS = str.maketrans("", "", "".join(chr(i) for i in range(256) if not (chr(i).isalnum() or chr(i) in " -_")))
+
+# ======================
+# Scholar Response Cache
+# ======================
+SCHOLAR_CACHE_PATH = pathlib.Path(".scholar_cache.sqlite")
+SCHOLAR_CACHE_TTL = 24 * 3600  # 24h
+
+class ScholarCache:
+    """SQLite cache of formatted Scholar results, keyed by (query, years_back)"""
+    
+    def __init__(self, path: pathlib.Path = SCHOLAR_CACHE_PATH, ttl: int = SCHOLAR_CACHE_TTL):
+        self.ttl = ttl
+        # Shared across the agent's worker threads; writes are serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS scholar (key TEXT PRIMARY KEY, value BLOB, ts INTEGER)")
+            self._conn.commit()
+    
+    @staticmethod
+    def make_key(query: str, years_back: int) -> str:
+        return hashlib.sha256(f"{query}|{years_back}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str):
+        """Return the cached result, or None if missing or older than the TTL"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM scholar WHERE key = ? AND ts > ?",
+                (key, int(time.time()) - self.ttl)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+    
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scholar (key, value, ts) VALUES (?, ?, ?)",
+                (key, zlib.compress(value.encode("utf-8")), int(time.time()))
+            )
+            self._conn.commit()
+
+@functools.lru_cache(maxsize=None)
+def get_scholar_cache() -> ScholarCache:
+    """Open the Scholar cache once, on first search"""
+    return ScholarCache()
+
 # ======================
 # Google Scholar Tool (Same as before)
 # ======================
@@ -24,131 +119,452 @@ class GoogleScholarTool(BaseTool):
     description: str = "Search Google Scholar for academic papers and research publications using Serper.dev API."
     args_schema: Type[BaseModel] = GoogleScholarSearchInput
     
-    def _run(self, query: str, years_back: int = 3) -> str:
-        """Search Google Scholar using Serper.dev API"""
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session, created lazily so the TLS connection is reused across _run calls"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+            self._session.headers.update(SCHOLAR_HEADERS)
+        return self._session
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=4),
+        retry=retry_if_exception_type((requests.Timeout, requests.ConnectionError, RetryableStatusError)),
+        reraise=True
+    )
+    def _post_with_retry(self, payload: dict) -> requests.Response:
+        """POST to Serper.dev, retrying timeouts, dropped connections and 429/5xx with backoff"""
+        response = self.session.post(SCHOLAR_URL, json=payload, timeout=10)
+        if response.status_code in RETRYABLE_STATUS:
+            raise RetryableStatusError(f"Serper.dev returned {response.status_code}", response=response)
+        return response
+    
+    @staticmethod
+    def _payload(query: str) -> dict:
+        """Payload for Serper.dev Scholar API"""
+        return {
+            "q": query,
+            "num": 6,  # Number of results
+            "hl": "en"  # Language
+        }
+    
+    @staticmethod
+    def _extract_year(result: dict) -> str:
+        """Publication year from publication info, falling back to the snippet"""
+        publication_info = result.get("publicationInfo") or {}
+        if "year" in publication_info:
+            return str(publication_info["year"])
+        year_match = _YEAR_RE.search(result.get("snippet", ""))
+        return year_match.group(1) if year_match else ""
+    
+    @staticmethod
+    def _keep(year: str, start_year: int) -> bool:
+        """Keep recent results, and results without clear year info"""
+        return not year or (year.isdigit() and int(year) >= start_year)
+    
+    @staticmethod
+    def _format_result(result: dict, year: str) -> str:
+        """Format a single Scholar hit"""
+        title = result.get("title", "")
+        link = result.get("link", "")
+        snippet = result.get("snippet", "")
+        authors = (result.get("publicationInfo") or {}).get("authors", "")
+        citations = result.get("citedBy", {}).get("total", 0)
+        
+        parts = [f"📄 **{title}**\n"]
+        if link:
+            parts.append(f"   Link: {link}\n")
+        if authors:
+            parts.append(f"   Authors: {authors}\n")
+        if year:
+            parts.append(f"   Year: {year}\n")
+        if citations > 0:
+            parts.append(f"   Citations: {citations}\n")
+        if snippet:
+            parts.append(f"   Abstract: {snippet}\n")
+        parts.append("\n")
+        return "".join(parts)
+    
+    def _format_results(self, query: str, years_back: int, data: dict) -> str:
+        """Format a Serper.dev Scholar response"""
+        # Calculate year range
+        start_year = datetime.now().year - years_back
+        
+        # Check if we have results
+        rs = data.get("organic") or []
+        if not rs:
+            return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
+        
+        # Top 6 results, filtered by year where one was found
+        formatted_results = [
+            self._format_result(r, year)
+            for r, year in ((r, self._extract_year(r)) for r in rs[:6])
+            if self._keep(year, start_year)
+        ]
+        
+        if not formatted_results:
+            return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
+        
+        body = "\n".join(formatted_results)
+        return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n{body}"
+    
+    def _search(self, query: str, years_back: int) -> str:
+        """One Scholar query through the disk cache and the retried pooled session"""
         try:
-            # Get API key
-            api_key = os.getenv("SERPER_API_KEY")
-            if not api_key:
-                return "❌ SERPER_API_KEY not found in environment variables"
-            
-            # Calculate year range
-            current_year = datetime.now().year
-            start_year = current_year - years_back
-            
-            # Serper.dev API endpoint for Google Scholar
-            url = "https://google.serper.dev/scholar"
-            
-            # Headers for Serper.dev
-            headers = {
-                'X-API-KEY': api_key,
-                'Content-Type': 'application/json'
-            }
+            # Serve repeated (query, years_back) pairs from disk instead of Serper.dev
+            cache = get_scholar_cache()
+            cache_key = cache.make_key(query, years_back)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Payload for Serper.dev Scholar API
-            payload = {
-                "q": query,
-                "num": 6,  # Number of results
-                "hl": "en"  # Language
-            }
-            
-            # Make API request
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            # The persistent session skips the TCP + TLS handshake after the first call
+            response = self._post_with_retry(self._payload(query))
             
             if response.status_code != 200:
                 return f"❌ API request failed with status {response.status_code}: {response.text}"
             
-            data = response.json()
-            
-            # Check if we have results
-            if "organic" not in data or not data["organic"]:
-                return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
-            
-            # Format results
-            formatted_results = []
-            for result in data["organic"][:6]:  # Top 6 results
-                title = result.get("title", "")
-                link = result.get("link", "")
-                snippet = result.get("snippet", "")
-                
-                # Extract publication info if available
-                publication_info = result.get("publicationInfo", {})
-                authors = publication_info.get("authors", "")
-                
-                # Extract year from snippet or publication info
-                year = ""
-                if publication_info and "year" in publication_info:
-                    year = str(publication_info["year"])
-                elif snippet:
-                    # Try to extract year from snippet (common format: "- 2023 - ...")
-                    year_match = re.search(r'\b(20\d{2})\b', snippet)
-                    if year_match:
-                        year = year_match.group(1)
-                
-                # Get citation count if available
-                citations = 0
-                if "citedBy" in result:
-                    citations = result["citedBy"].get("total", 0)
-                
-                # Format result
-                result_text = f"📄 **{title}**\n"
-                if link:
-                    result_text += f"   Link: {link}\n"
-                if authors:
-                    result_text += f"   Authors: {authors}\n"
-                if year:
-                    result_text += f"   Year: {year}\n"
-                if citations > 0:
-                    result_text += f"   Citations: {citations}\n"
-                if snippet:
-                    result_text += f"   Abstract: {snippet}\n"
-                result_text += "\n"
-                
-                # Filter by year if specified and we found a year
-                if year and year.isdigit() and int(year) >= start_year:
-                    formatted_results.append(result_text)
-                elif not year:  # Include results without clear year info
-                    formatted_results.append(result_text)
-            
-            if formatted_results:
-                return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n" + "\n".join(formatted_results)
-            else:
-                return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
-                
+            data = orjson.loads(response.content)
+            formatted = self._format_results(query, years_back, data)
+            cache.set(cache_key, formatted)
+            return formatted
+            
+        except RetryableStatusError as e:
+            return f"❌ API request failed with status {e.response.status_code}: {e.response.text}"
         except requests.exceptions.Timeout:
             return "❌ Google Scholar search timed out. Try again."
         except requests.exceptions.RequestException as e:
             return f"❌ Network error during Google Scholar search: {str(e)}"
         except Exception as e:
             return f"❌ Google Scholar search failed: {str(e)}"
+    
+    def _run(self, query: str, years_back: int = 3) -> str:
+        """Search Google Scholar using Serper.dev API"""
+        return self._search(query, years_back)
+
+class GoogleScholarBatchSearchInput(BaseModel):
+    """Input schema for several Google Scholar searches at once."""
+    queries: List[str] = Field(..., description="Search queries for Google Scholar (up to 6)")
+    years_back: int = Field(default=3, description="Number of years back to search (default: 3)")
+
+# Scholar queries per batch call, and how many run at once on the pooled session
+SCHOLAR_BATCH_MAX = 6
+
+class GoogleScholarBatchTool(GoogleScholarTool):
+    name: str = "google_scholar_batch_search"
+    description: str = "Search Google Scholar for several queries at once (they run concurrently) using Serper.dev API."
+    args_schema: Type[BaseModel] = GoogleScholarBatchSearchInput
+    
+    def _run(self, queries: List[str], years_back: int = 3) -> str:
+        """Fan the queries out over the pooled session; each goes through the same cache and retries"""
+        queries = list(dict.fromkeys(queries))[:SCHOLAR_BATCH_MAX]
+        if not queries:
+            return "🔬 No queries provided for Google Scholar batch search."
+        
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = executor.map(self._search, queries, [years_back] * len(queries))
+            return "\n\n---\n\n".join(results)
+
+# ======================
+# Semantic LLM Response Cache
+# ======================
+LLM_CACHE_DIR = "multi_agent_content/.cache"
+
+@functools.lru_cache(maxsize=None)
+def get_embedder(model_name: str = "all-MiniLM-L6-v2"):
+    """Load the sentence-embedding model once, on first cache lookup"""
+    from sentence_transformers import SentenceTransformer
+    
+    return SentenceTransformer(model_name)
+
+class EmbeddingService:
+    """Collects concurrent embedding requests and encodes them in one batched call"""
+    
+    def __init__(self, max_batch: int = 32, max_wait: float = 0.02):
+        self.max_batch = max_batch
+        self.max_wait = max_wait  # Debounce window for gathering a batch
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+    
+    def _drain(self):
+        """Background loop: take up to max_batch prompts or max_wait seconds, then encode once"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                vectors = get_embedder().encode(
+                    prompts, batch_size=len(prompts), normalize_embeddings=True, convert_to_numpy=True
+                ).astype("float32")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            
+            for i, (_, future) in enumerate(batch):
+                future.set_result(vectors[i:i + 1])
+    
+    def embed(self, prompt: str, timeout: float = 10.0):
+        """Embed a prompt as a normalized float32 row vector, batched with concurrent callers (TimeoutError if stuck)"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, daemon=True)
+                self._worker.start()
+        
+        future = Future()
+        self._queue.put((prompt, future))
+        return future.result(timeout=timeout)
+
+embed_service = EmbeddingService()
+
+def embed_prompt(prompt: str):
+    """Embed a prompt as a normalized float32 row vector"""
+    return embed_service.embed(prompt)
+
+def split_messages(messages):
+    """(query, context key): the last user message is matched semantically, everything else by exact hash.
+    
+    MiniLM truncates at 256 tokens, so embedding the whole transcript would only see the shared
+    system/backstory prefix and match every call from the same agent.
+    """
+    if isinstance(messages, str):
+        return messages, hashlib.sha256(b"").hexdigest()
+    
+    last_user = max((i for i, m in enumerate(messages) if m.get("role") == "user"), default=len(messages) - 1)
+    query = messages[last_user].get("content", "") if messages else ""
+    rest = messages[:last_user] + messages[last_user + 1:]
+    context = hashlib.sha256(json.dumps(rest, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return query if isinstance(query, str) else json.dumps(query, default=str), context
+
+# Nearest cached queries checked for an exact context match
+LOOKUP_NEIGHBOURS = 8
+
+# Below this size NumPy's BLAS matmul beats paying the JIT warm-up
+NUMBA_MIN_ENTRIES = 10_000
+
+@functools.lru_cache(maxsize=None)
+def _numba_dot_scores():
+    """JIT-compiled scan, built the first time a cache grows past NUMBA_MIN_ENTRIES"""
+    import numpy as np
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True, cache=True)  # cache=True: compile once, not per process
+    def _dot_scores(mat, q):
+        """Inner product of every cached embedding (row of mat) with the query"""
+        out = np.empty(mat.shape[0], np.float32)
+        for i in prange(mat.shape[0]):
+            s = 0.0
+            for j in range(mat.shape[1]):
+                s += mat[i, j] * q[j]
+            out[i] = s
+        return out
+    
+    return _dot_scores
+
+def similarity_scores(mat, q):
+    """Cosine scores of a normalized query against a contiguous (N, d) float32 matrix"""
+    if NUMBA_AVAILABLE and mat.shape[0] >= NUMBA_MIN_ENTRIES:
+        return _numba_dot_scores()(mat, q)
+    return mat @ q
+
+class SemanticLLMCache:
+    """Disk-backed cache of LLM completions, looked up by prompt embedding similarity"""
+    
+    def __init__(self, namespace: str, embed_fn=embed_prompt, threshold: float = 0.92, ttl: int = 3600,
+                 max_entries: int = 2000, cache_dir: str = LLM_CACHE_DIR):
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_dir = os.path.join(cache_dir, namespace)
+        # Append-only log, one JSON line (embedding, context, response, ts) per completion
+        self.log_path = os.path.join(self.cache_dir, "entries.jsonl")
+        # FAISS index when installed, otherwise a single (N, d) embedding matrix; rebuilt from the log in memory
+        import numpy as np
+        self.np = np
+        self.use_faiss = FAISS_AVAILABLE
+        if self.use_faiss:
+            import faiss
+            self.faiss = faiss
+        self._lock = threading.Lock()  # CrewAI may call the LLM from worker threads
+        self.index = None  # Created on first store, once the embedding size is known
+        self.entries = []
+        
+        # Load the persisted log so the cache survives restarts
+        if os.path.exists(self.log_path):
+            self._compact(self.max_entries)
+    
+    def _compact(self, limit: int):
+        """Keep the newest `limit` unexpired log rows, rebuild the index from them; rewrite the log if rows were dropped"""
+        with open(self.log_path, "rb") as f:
+            rows = [orjson.loads(line) for line in f if line.strip()]
+        cutoff = time.time() - self.ttl
+        kept = [row for row in rows if row["ts"] >= cutoff][-limit:]
+        self.entries = [{"response": row["response"], "context": row["context"], "ts": row["ts"]} for row in kept]
+        self.index = None
+        if kept:
+            vectors = self.np.asarray([row["embedding"] for row in kept], dtype="float32")
+            if self.use_faiss:
+                self.index = self.faiss.IndexFlatIP(vectors.shape[1])
+                self.index.add(vectors)
+            else:
+                self.index = vectors
+        if len(kept) != len(rows):
+            tmp_path = self.log_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.writelines(orjson.dumps(row) + b"\n" for row in kept)
+            os.replace(tmp_path, self.log_path)
+    
+    def lookup(self, query: str, context: str):
+        """Return (cached response or None, query embedding); a hit needs a similar query AND the exact same context"""
+        embedding = self.embed_fn(query)
+        with self._lock:
+            if self.index is None or not self.entries:
+                return None, embedding
+            
+            # Inner product over normalized vectors == cosine similarity; check a few neighbours since context must match too
+            k = min(LOOKUP_NEIGHBOURS, len(self.entries))
+            if self.use_faiss:
+                scores, ids = self.index.search(embedding, k)
+                candidates = zip(ids[0], scores[0])
+            else:
+                scores = similarity_scores(self.index, embedding[0])
+                top = self.np.argsort(scores)[::-1][:k]
+                candidates = zip(top, scores[top])
+            
+            now = time.time()
+            for idx, score in candidates:
+                if idx < 0 or score < self.threshold:
+                    break
+                entry = self.entries[int(idx)]
+                if entry.get("context") == context and now - entry["ts"] <= self.ttl:
+                    return entry["response"], embedding
+        return None, embedding
+    
+    def store(self, embedding, context: str, response: str):
+        """Append a completion to the log and the in-memory index"""
+        row = {"embedding": embedding[0].tolist(), "context": context, "response": response, "ts": time.time()}
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.log_path, "ab") as f:
+                f.write(orjson.dumps(row) + b"\n")
+            
+            if self.use_faiss:
+                if self.index is None:
+                    self.index = self.faiss.IndexFlatIP(embedding.shape[1])
+                self.index.add(embedding)
+            else:
+                self.index = embedding.copy() if self.index is None else self.np.vstack([self.index, embedding])
+            self.entries.append({"response": response, "context": context, "ts": row["ts"]})
+            
+            # Over the cap: drop expired and oldest rows down to 3/4 of it so compaction stays rare
+            if len(self.entries) > self.max_entries:
+                self._compact(self.max_entries * 3 // 4)
+
+class CachedLLM(LLM):
+    """LLM that serves semantically similar prompts from a per-role cache before calling the API"""
+    
+    def __init__(self, *args, cache_namespace: str, threshold: float = 0.92, ttl: int = 3600, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Separate namespace per agent role (and model) so research hits never poison writing
+        self._cache_args = (f"{cache_namespace}_{hashlib.sha256(kwargs.get('model', '').encode('utf-8')).hexdigest()[:8]}", threshold, ttl)
+        self._response_cache = None  # Built on the first call: these LLMs are created at import
+        self._cache_lock = threading.Lock()
+    
+    @property
+    def response_cache(self):
+        """The role's SemanticLLMCache (None without sentence-transformers), loaded on first use"""
+        if SEMANTIC_CACHE_AVAILABLE and self._response_cache is None:
+            with self._cache_lock:
+                if self._response_cache is None:
+                    namespace, threshold, ttl = self._cache_args
+                    self._response_cache = SemanticLLMCache(namespace, threshold=threshold, ttl=ttl)
+        return self._response_cache
+    
+    def call(self, messages, *args, **kwargs):
+        # Cache failures (loading the cache or model, OOM, stuck embedder) are misses, never failed LLM calls
+        cache = cached = None
+        try:
+            cache = self.response_cache
+            if cache is not None:
+                query, context = split_messages(messages)
+                cached, embedding = cache.lookup(query, context)
+        except Exception as e:
+            logger.warning("⚠️ LLM cache lookup failed, calling the API: %s", e)
+            cache = None
+        if cache is None:
+            return super().call(messages, *args, **kwargs)
+        if cached is not None:
+            return cached
+        
+        response = super().call(messages, *args, **kwargs)
+        if isinstance(response, str):
+            try:
+                cache.store(embedding, context, response)
+            except Exception as e:
+                logger.warning("⚠️ LLM cache store failed: %s", e)
+        return response
 
 # ======================
 # LLM Configurations - Multi-Model Setup
 # ======================
 
 # Qwen 3-32B for Research (Fast and efficient for research tasks)
-research_llm = LLM(
+research_llm = CachedLLM(
+    cache_namespace="research",
     model="groq/qwen/qwen3-32b",
-    api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.3,  # Lower temperature for more focused research
-    max_tokens=3000
+    api_key=_GROQ_KEY,
+    temperature=0.4,  # Focused research without lossy sampling retries
+    max_tokens=1500  # Summarizing sources needs far less than the writer; generation time scales with the budget
 )
 
 # DeepSeek R1 for Content Creation (More creative and comprehensive)
-content_llm = LLM(
+content_llm = CachedLLM(
+    cache_namespace="content",
     model="groq/deepseek-r1-distill-llama-70b",
-    api_key=os.getenv("GROQ_API_KEY"),
+    api_key=_GROQ_KEY,
     temperature=0.6,  # Higher temperature for creative writing
-    max_tokens=4000
+    max_tokens=6000  # Blog (4000) + social (2000) budgets: both come back in one structured call
 )
 
-# DeepSeek R1 for Social Media (Creative and engaging)
-social_llm = LLM(
-    model="groq/deepseek-r1-distill-llama-70b",
-    api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.7,  # Higher temperature for engaging social content
-    max_tokens=2000
-)
+# ======================
+# Structured Output
+# ======================
+class ContentBundle(BaseModel):
+    """Blog post and social media package produced in a single LLM call"""
+    blog_md: str = Field(..., description="Complete technical blog post in markdown")
+    linkedin_en: str = Field(..., description="English LinkedIn post")
+    linkedin_tr: str = Field(..., description="Turkish LinkedIn post")
+    twitter_en: str = Field(..., description="English X/Twitter thread")
+    twitter_tr: str = Field(..., description="Turkish X/Twitter thread")
+    midjourney_prompts: str = Field(..., description="3 detailed MidJourney prompts with parameters")
+
+# DeepSeek R1 reasons in <think> blocks (which may contain braces) before the JSON
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+def parse_content_bundle(task_output) -> Optional[ContentBundle]:
+    """ContentBundle from a task output, tolerating <think> blocks and fenced JSON; None if it still doesn't validate"""
+    if task_output.pydantic is not None:
+        return task_output.pydantic
+    raw = _THINK_RE.sub("", task_output.raw)
+    try:
+        return ContentBundle.model_validate(orjson.loads(raw[raw.find("{"):raw.rfind("}") + 1]))
+    except (orjson.JSONDecodeError, ValueError):
+        return None
 
 # ======================
 # Multi-Agent Content Creator Class
@@ -156,93 +572,9 @@ social_llm = LLM(
 class MultiAgentContentCreator:
     """Multi-agent content creator with specialized agents for different tasks"""
     
-    def __init__(self):
-        # Initialize tools
-        self.scholar_tool = GoogleScholarTool()
-        self.serper_tool = SerperDevTool()
-        self.scraper_tool = ScrapeWebsiteTool()
-        
-        # Research Agent - Uses Qwen 3-32B for efficient research
-        self.researcher = Agent(
-            role="Senior Research Analyst",
-            goal="Conduct comprehensive research on '{topic}' using academic sources, web search, and content scraping to gather factual, up-to-date information.",
-            backstory="""You are a meticulous research analyst with expertise in finding and synthesizing 
-            information from multiple sources. You excel at:
-            
-            - Finding relevant academic papers and research studies
-            - Gathering current industry data and statistics
-            - Identifying credible sources and fact-checking information
-            - Extracting key insights from complex documents
-            - Organizing research findings in a structured manner
-            - Distinguishing between reliable and unreliable sources
-            
-            You use Google Scholar for academic research, web search for current trends, 
-            and content scraping for detailed information extraction. Your research forms 
-            the foundation for all content creation.""",
-            tools=[self.scholar_tool, self.serper_tool, self.scraper_tool],
-            llm=research_llm,  # Qwen 3-32B for research
-            verbose=True,
-            max_iter=4,  # More iterations for thorough research
-            max_rpm=6,
-            allow_delegation=False
-        )
-        
-        # Content Writer Agent - Uses DeepSeek R1 for creative writing
-        self.content_writer = Agent(
-            role="Senior Technical Content Writer",
-            goal="Create comprehensive, engaging technical blog posts about '{topic}' based on research findings, with a focus on practical implementation and real-world applications.",
-            backstory="""You are an experienced technical writer with 10+ years in data science 
-            and technology. You specialize in:
-            
-            - Transforming complex research into accessible technical content
-            - Writing comprehensive blog posts (1000-1500 words)
-            - Including code examples and practical implementations
-            - Explaining technical concepts with real-world analogies
-            - Creating engaging introductions and compelling conclusions
-            - Structuring content for maximum readability and impact
-            - Balancing technical depth with accessibility
-            
-            You take research findings and craft them into compelling, informative 
-            blog posts that provide genuine value to technical professionals. You write 
-            from personal experience and include practical insights.""",
-            tools=[],  # No tools needed, works with research findings
-            llm=content_llm,  # DeepSeek R1 for content creation
-            verbose=True,
-            max_iter=3,
-            max_rpm=4,
-            allow_delegation=False
-        )
-        
-        # Social Media Specialist - Uses DeepSeek R1 for engaging content
-        self.social_media_specialist = Agent(
-            role="Social Media Content Specialist",
-            goal="Create engaging social media content for LinkedIn and Twitter in both English and Turkish, plus generate detailed MidJourney prompts for visual content about '{topic}'.",
-            backstory="""You are a social media expert who specializes in technical content 
-            for professional audiences. You excel at:
-            
-            - Adapting technical content for social media platforms
-            - Creating engaging LinkedIn posts for professional networks
-            - Crafting Twitter threads that capture attention
-            - Translating content culturally for Turkish audiences
-            - Generating detailed prompts for AI image generation
-            - Using appropriate hashtags and calls-to-action
-            - Maintaining brand voice across different platforms
-            
-            You take comprehensive blog content and transform it into bite-sized, 
-            shareable content that drives engagement while maintaining technical accuracy. 
-            You understand the nuances of different social platforms and cultural adaptation.""",
-            tools=[],  # No tools needed, works with blog content
-            llm=social_llm,  # DeepSeek R1 for social content
-            verbose=True,
-            max_iter=2,
-            max_rpm=4,
-            allow_delegation=False
-        )
-
-    def create_research_task(self, topic):
-        """Task for the research agent"""
-        return Task(
-            description=f"""
+    # Static prompt templates: CrewAI fills {topic} from kickoff inputs,
+    # so the text is built once and the prompt prefix stays identical across runs
+    _RESEARCH_DESC = """
             Conduct comprehensive research on the topic: '{topic}'
             
             🔬 RESEARCH OBJECTIVES:
@@ -280,16 +612,11 @@ class MultiAgentContentCreator:
             
             Focus on factual, up-to-date information that will serve as the foundation 
             for creating high-quality technical content.
-            """,
-            expected_output="Comprehensive research report with academic sources, industry data, technical examples, and key insights about the topic",
-            agent=self.researcher
-        )
-
-    def create_content_writing_task(self, topic):
-        """Task for the content writer agent"""
-        return Task(
-            description=f"""
-            Create a comprehensive technical blog post about '{topic}' based on the research findings.
+            """
+    
+    _BUNDLE_DESC = """
+            Create a comprehensive technical blog post about '{topic}' based on the research findings,
+            plus the social media package that promotes it.
             
             📝 CONTENT CREATION OBJECTIVES:
             
@@ -324,194 +651,273 @@ class MultiAgentContentCreator:
             - Add code blocks where appropriate
             - Structure for easy reading and scanning
             
+            5. SOCIAL MEDIA PACKAGE (based on the blog post you just wrote):
+            - linkedin_en: English LinkedIn post (250-300 words) for data science/tech professionals
+            - linkedin_tr: Turkish LinkedIn post, culturally adapted for Turkish business audience
+            - twitter_en: English X/Twitter thread of 3-4 tweets, each under 280 characters
+            - twitter_tr: Turkish X/Twitter thread adapted for the Turkish tech community
+            - midjourney_prompts: 3 detailed MidJourney prompts for technical blog visuals
+              (technical elements, --ar 16:9 for blog headers, --ar 1:1 for social media,
+              dark themes with neon accents, --v 6 --style modern tech)
+            - Add relevant hashtags (#DataScience #MachineLearning #AI #Technology) and calls-to-action
+            - Ensure cultural sensitivity for Turkish content
+            
             Write as a practicing data scientist/technologist sharing genuine insights 
             and practical knowledge with fellow professionals.
-            """,
-            expected_output="Comprehensive technical blog post (1000-1500 words) with practical insights, code examples, and real-world applications",
-            agent=self.content_writer
+            
+            Return a single JSON object with the string fields blog_md, linkedin_en, linkedin_tr,
+            twitter_en, twitter_tr and midjourney_prompts. blog_md holds the full markdown blog post.
+            """
+    
+    def __init__(self):
+        # Fail fast here rather than deep inside the research loop
+        missing = [name for name, key in (("SERPER_API_KEY", _SERPER_KEY), ("GROQ_API_KEY", _GROQ_KEY)) if not key]
+        if missing:
+            raise ValueError(f"❌ Missing API keys: {', '.join(missing)}. Add them to your .env file.")
+        
+        # Headless/scheduled runs skip CrewAI's Rich step output and our progress logs
+        self.verbose = os.getenv("VERBOSE", "0") == "1"
+        logger.setLevel(logging.INFO if self.verbose else logging.WARNING)
+        
+        # Initialize tools
+        self.scholar_tool = GoogleScholarBatchTool()
+        self.serper_tool = SerperDevTool()
+        self.scraper_tool = ScrapeWebsiteTool()
+        
+        # Research Agent - Uses Qwen 3-32B for efficient research
+        self.researcher = Agent(
+            role="Senior Research Analyst",
+            goal="Conduct comprehensive research on the assigned topic using academic sources, web search, and content scraping to gather factual, up-to-date information.",
+            backstory="""You are a meticulous research analyst with expertise in finding and synthesizing 
+            information from multiple sources. You excel at:
+            
+            - Finding relevant academic papers and research studies
+            - Gathering current industry data and statistics
+            - Identifying credible sources and fact-checking information
+            - Extracting key insights from complex documents
+            - Organizing research findings in a structured manner
+            - Distinguishing between reliable and unreliable sources
+            
+            You use Google Scholar for academic research, web search for current trends, 
+            and content scraping for detailed information extraction. Your research forms 
+            the foundation for all content creation.""",
+            tools=[self.scholar_tool, self.serper_tool, self.scraper_tool],
+            llm=research_llm,  # Qwen 3-32B for research
+            verbose=self.verbose,
+            max_iter=4,  # More iterations for thorough research
+            max_rpm=6,
+            allow_delegation=False
         )
+        
+        # Content Writer Agent - Uses DeepSeek R1 for creative writing
+        self.content_writer = Agent(
+            role="Senior Technical Content Writer",
+            goal="Create comprehensive, engaging technical blog posts on the assigned topic based on research findings, with a focus on practical implementation and real-world applications, plus the LinkedIn, Twitter and MidJourney content that promotes them.",
+            backstory="""You are an experienced technical writer with 10+ years in data science 
+            and technology. You specialize in:
+            
+            - Transforming complex research into accessible technical content
+            - Writing comprehensive blog posts (1000-1500 words)
+            - Including code examples and practical implementations
+            - Explaining technical concepts with real-world analogies
+            - Creating engaging introductions and compelling conclusions
+            - Structuring content for maximum readability and impact
+            - Balancing technical depth with accessibility
+            - Adapting posts for LinkedIn and X/Twitter in English and Turkish
+            - Generating detailed prompts for AI image generation
+            
+            You take research findings and craft them into compelling, informative 
+            blog posts that provide genuine value to technical professionals, then 
+            distill them into shareable social content. You write from personal 
+            experience and include practical insights.""",
+            tools=[],  # No tools needed, works with research findings
+            llm=content_llm,  # DeepSeek R1 for content creation
+            verbose=self.verbose,
+            max_iter=3,
+            max_rpm=4,
+            allow_delegation=False
+        )
+        
+        # Crew and tasks are built on first use and reused for every topic
+        self._crew = None
+        self._tasks = None
 
-    def create_social_media_task(self, topic):
-        """Task for the social media specialist"""
+    def create_research_task(self):
+        """Task for the research agent"""
         return Task(
-            description=f"""
-            Create engaging social media content and visual prompts for '{topic}' based on the blog post content.
-            
-            📱 SOCIAL MEDIA OBJECTIVES:
-            
-            1. LINKEDIN POSTS:
-            - English: Professional post (250-300 words) for data science/tech professionals
-            - Turkish: Culturally adapted version for Turkish business audience
-            - Include key insights from the blog post
-            - Add relevant hashtags (#DataScience #MachineLearning #AI #Technology)
-            - Include call-to-action for engagement
-            
-            2. X/TWITTER POSTS:
-            - English: Create 3-4 tweet thread with key insights and technical highlights
-            - Turkish: Adapt the thread for Turkish tech community
-            - Keep each tweet under 280 characters
-            - Include code snippets or technical examples where possible
-            - Use relevant hashtags and mentions
-            
-            3. MIDJOURNEY PROMPTS:
-            - Create 3 detailed MidJourney prompts for technical blog visuals
-            - Include technical elements (code, diagrams, data flows, AI concepts)
-            - Specify aspect ratios (--ar 16:9 for blog headers, --ar 1:1 for social media)
-            - Use professional tech aesthetics (dark themes, neon accents, clean minimal)
-            - Include version and style parameters (--v 6 --style modern tech)
-            
-            4. CONTENT ADAPTATION:
-            - Extract key points from the blog post
-            - Adapt technical content for social media consumption
-            - Maintain accuracy while making it engaging
-            - Consider platform-specific best practices
-            - Ensure cultural sensitivity for Turkish content
-            
-            Format your response:
-            # LINKEDIN POSTS
-            ## English
-            [LinkedIn content]
-            ## Turkish  
-            [Turkish LinkedIn content]
-            
-            # X/TWITTER POSTS
-            ## English
-            [Twitter thread]
-            ## Turkish
-            [Turkish Twitter thread]
-            
-            # MIDJOURNEY PROMPTS
-            [3 detailed MidJourney prompts with parameters]
-            """,
-            expected_output="Complete social media package with LinkedIn posts, Twitter threads (English & Turkish), and MidJourney prompts for visual content",
-            agent=self.social_media_specialist
+            description=self._RESEARCH_DESC,
+            expected_output="Comprehensive research report with academic sources, industry data, technical examples, and key insights about the topic",
+            agent=self.researcher
+        )
+
+    def create_blog_and_social_task(self):
+        """Single task for the blog post and social package, so the research is read once"""
+        return Task(
+            description=self._BUNDLE_DESC,
+            expected_output="JSON object with the technical blog post (1000-1500 words) and the LinkedIn, Twitter (English & Turkish) and MidJourney content",
+            output_pydantic=ContentBundle,
+            agent=self.content_writer
         )
 
+    @staticmethod
+    def format_social_content(bundle):
+        """Assemble the bundle's social fields into the single-document layout"""
+        return (
+            f"# LINKEDIN POSTS\n## English\n{bundle.linkedin_en}\n\n## Turkish\n{bundle.linkedin_tr}\n\n"
+            f"# X/TWITTER POSTS\n## English\n{bundle.twitter_en}\n\n## Turkish\n{bundle.twitter_tr}\n\n"
+            f"# MIDJOURNEY PROMPTS\n{bundle.midjourney_prompts}\n"
+        )
+
+    @staticmethod
+    def _write_file(path, content):
+        """Write one pre-assembled output file in a single call"""
+        path = pathlib.Path(path)
+        path.write_text(content, encoding="utf-8")
+        return path.name
+
     def save_content_to_files(self, topic, research_result, content_result, social_result):
         """Save all content to organized files"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        ts = now.strftime('%Y-%m-%d %H:%M:%S')
+        safe_topic = topic.translate(_SLUG_TRANS).rstrip()[:50]
         output_dir = f"multi_agent_content/{safe_topic}_{timestamp}"
         os.makedirs(output_dir, exist_ok=True)
         
-        print(f"\n💾 Saving multi-agent content to: {output_dir}")
+        logger.info("\n💾 Saving multi-agent content to: %s", output_dir)
+        
+        # Serialize each result exactly once
+        r_str, c_str, s_str = map(str, (research_result, content_result, social_result))
+        
+        files = {}
+        
+        # Research findings
+        files["01_research_findings.md"] = (
+            f"# Research Findings: {topic}\n\n"
+            f"*Generated by Research Agent (Qwen 3-32B) on: {ts}*\n\n"
+            f"{r_str}"
+        )
         
-        # Save research findings
-        with open(f"{output_dir}/01_research_findings.md", "w", encoding="utf-8") as f:
-            f.write(f"# Research Findings: {topic}\n\n")
-            f.write(f"*Generated by Research Agent (Qwen 3-32B) on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(str(research_result))
-        print("✅ Saved: 01_research_findings.md")
+        # Main blog post
+        files["02_technical_blog_post.md"] = (
+            f"# {topic}\n\n"
+            f"*Generated by Content Writer Agent (DeepSeek R1) on: {ts}*\n\n"
+            f"{c_str}"
+        )
         
-        # Save main blog post
-        with open(f"{output_dir}/02_technical_blog_post.md", "w", encoding="utf-8") as f:
-            f.write(f"# {topic}\n\n")
-            f.write(f"*Generated by Content Writer Agent (DeepSeek R1) on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(str(content_result))
-        print("✅ Saved: 02_technical_blog_post.md")
+        # Social media content
+        files["03_social_media_content.md"] = (
+            f"# Social Media Content: {topic}\n\n"
+            f"*Generated by Content Writer Agent (DeepSeek R1) on: {ts}*\n\n"
+            f"{s_str}"
+        )
         
-        # Save social media content
-        with open(f"{output_dir}/03_social_media_content.md", "w", encoding="utf-8") as f:
-            f.write(f"# Social Media Content: {topic}\n\n")
-            f.write(f"*Generated by Social Media Specialist (DeepSeek R1) on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-            f.write(str(social_result))
-        print("✅ Saved: 03_social_media_content.md")
+        # Complete package
+        header = (
+            f"# Complete Multi-Agent Content Package: {topic}\n\n"
+            f"**Generated:** {ts}\n"
+            "**Architecture:** Multi-Agent System\n"
+            "**Research Model:** Qwen 3-32B\n"
+            "**Content Model:** DeepSeek R1 Distill Llama 70B\n"
+            "**Social Model:** DeepSeek R1 Distill Llama 70B (same call as the blog post)\n\n"
+        )
+        files["complete_multi_agent_content.md"] = "".join([
+            header,
+            "---\n\n# RESEARCH FINDINGS\n\n", r_str,
+            "\n\n---\n\n# TECHNICAL BLOG POST\n\n", c_str,
+            "\n\n---\n\n# SOCIAL MEDIA CONTENT\n\n", s_str,
+        ])
         
-        # Save complete package
-        with open(f"{output_dir}/complete_multi_agent_content.md", "w", encoding="utf-8") as f:
-            f.write(f"# Complete Multi-Agent Content Package: {topic}\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Architecture:** Multi-Agent System\n")
-            f.write(f"**Research Model:** Qwen 3-32B\n")
-            f.write(f"**Content Model:** DeepSeek R1 Distill Llama 70B\n")
-            f.write(f"**Social Model:** DeepSeek R1 Distill Llama 70B\n\n")
-            f.write("---\n\n")
-            f.write("# RESEARCH FINDINGS\n\n")
-            f.write(str(research_result))
-            f.write("\n\n---\n\n")
-            f.write("# TECHNICAL BLOG POST\n\n")
-            f.write(str(content_result))
-            f.write("\n\n---\n\n")
-            f.write("# SOCIAL MEDIA CONTENT\n\n")
-            f.write(str(social_result))
-        print("✅ Saved: complete_multi_agent_content.md")
+        # Comprehensive README
+        files["README.md"] = (
+            f"# Multi-Agent Content Package: {topic}\n\n"
+            f"**Generated:** {ts}\n"
+            "**Architecture:** Multi-Agent System with Specialized LLMs\n\n"
+            
+            "## 🤖 Agent Architecture:\n\n"
+            "- **Research Agent**: Qwen 3-32B (Efficient research and data gathering)\n"
+            "- **Content Writer**: DeepSeek R1 Distill Llama 70B (Technical writing + social content in one structured call)\n\n"
+            
+            "## 📁 Files Generated:\n\n"
+            "- ✅ `01_research_findings.md` - Comprehensive research by Research Agent\n"
+            "- ✅ `02_technical_blog_post.md` - **MAIN TECHNICAL BLOG** (1000-1500 words)\n"
+            "- ✅ `03_social_media_content.md` - LinkedIn & Twitter content + MidJourney prompts\n"
+            "- ✅ `complete_multi_agent_content.md` - All content in one file\n"
+            "- ✅ `README.md` - This file\n\n"
+            
+            "## 🔬 Multi-Agent Workflow:\n\n"
+            "1. **Research Phase**: Research Agent gathers academic papers, industry data, and technical examples\n"
+            "2. **Content Creation**: Content Writer transforms research into comprehensive blog post\n"
+            "3. **Social Adaptation**: Content Writer returns platform-specific posts alongside the blog\n\n"
+            
+            "## ✨ Content Features:\n\n"
+            "✅ **Research-Backed**: Academic sources + industry data\n"
+            "✅ **Technical Depth**: Code examples and practical implementation\n"
+            "✅ **Multi-Platform**: Blog, LinkedIn, Twitter content\n"
+            "✅ **Bilingual**: English and Turkish social media content\n"
+            "✅ **Visual Ready**: MidJourney prompts for professional visuals\n"
+            "✅ **Specialized LLMs**: Optimized models for each task\n\n"
+            
+            "## 🎯 Usage:\n\n"
+            "- **For Blog**: Use `02_technical_blog_post.md`\n"
+            "- **For Social Media**: Use `03_social_media_content.md`\n"
+            "- **For Research**: Reference `01_research_findings.md`\n"
+        )
         
-        # Create comprehensive README
-        with open(f"{output_dir}/README.md", "w", encoding="utf-8") as f:
-            f.write(f"# Multi-Agent Content Package: {topic}\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Architecture:** Multi-Agent System with Specialized LLMs\n\n")
-            
-            f.write("## 🤖 Agent Architecture:\n\n")
-            f.write("- **Research Agent**: Qwen 3-32B (Efficient research and data gathering)\n")
-            f.write("- **Content Writer**: DeepSeek R1 Distill Llama 70B (Creative technical writing)\n")
-            f.write("- **Social Media Specialist**: DeepSeek R1 Distill Llama 70B (Engaging social content)\n\n")
-            
-            f.write("## 📁 Files Generated:\n\n")
-            f.write("- ✅ `01_research_findings.md` - Comprehensive research by Research Agent\n")
-            f.write("- ✅ `02_technical_blog_post.md` - **MAIN TECHNICAL BLOG** (1000-1500 words)\n")
-            f.write("- ✅ `03_social_media_content.md` - LinkedIn & Twitter content + MidJourney prompts\n")
-            f.write("- ✅ `complete_multi_agent_content.md` - All content in one file\n")
-            f.write("- ✅ `README.md` - This file\n\n")
-            
-            f.write("## 🔬 Multi-Agent Workflow:\n\n")
-            f.write("1. **Research Phase**: Research Agent gathers academic papers, industry data, and technical examples\n")
-            f.write("2. **Content Creation**: Content Writer transforms research into comprehensive blog post\n")
-            f.write("3. **Social Adaptation**: Social Media Specialist creates platform-specific content\n\n")
-            
-            f.write("## ✨ Content Features:\n\n")
-            f.write("✅ **Research-Backed**: Academic sources + industry data\n")
-            f.write("✅ **Technical Depth**: Code examples and practical implementation\n")
-            f.write("✅ **Multi-Platform**: Blog, LinkedIn, Twitter content\n")
-            f.write("✅ **Bilingual**: English and Turkish social media content\n")
-            f.write("✅ **Visual Ready**: MidJourney prompts for professional visuals\n")
-            f.write("✅ **Specialized LLMs**: Optimized models for each task\n\n")
-            
-            f.write("## 🎯 Usage:\n\n")
-            f.write("- **For Blog**: Use `02_technical_blog_post.md`\n")
-            f.write("- **For Social Media**: Use `03_social_media_content.md`\n")
-            f.write("- **For Research**: Reference `01_research_findings.md`\n")
+        # Independent files, so overlap the disk I/O
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for name in executor.map(self._write_file, (f"{output_dir}/{n}" for n in files), files.values()):
+                logger.info("✅ Saved: %s", name)
         
-        print("✅ Saved: README.md")
-        print(f"📊 Successfully created 5 files with multi-agent architecture")
+        logger.info("📊 Successfully created %d files with multi-agent architecture", len(files))
         
         return output_dir
 
-    def create_content(self, topic):
+    def get_crew(self):
+        """Build the crew once; task templates carry {topic}, so kickoff inputs fill it per run"""
+        if self._crew is None:
+            # Research -> one fused blog + social call, so the research context is sent once
+            self._tasks = [self.create_research_task(), self.create_blog_and_social_task()]
+            self._crew = Crew(
+                agents=[self.researcher, self.content_writer],
+                tasks=self._tasks,
+                process=Process.sequential,  # Research -> Content + Social
+                verbose=self.verbose,
+                max_rpm=3  # Conservative rate limiting
+            )
+        return self._crew
+
+    async def create_content_async(self, topic):
         """Main function to create content using multi-agent system"""
-        print(f"\n🤖 Creating multi-agent content for: '{topic}'")
-        print("🔬 Research Agent: Qwen 3-32B")
-        print("✍️  Content Writer: DeepSeek R1 Distill Llama 70B")
-        print("📱 Social Media: DeepSeek R1 Distill Llama 70B")
-        print("="*70)
+        logger.info("\n🤖 Creating multi-agent content for: '%s'", topic)
+        logger.info("🔬 Research Agent: Qwen 3-32B")
+        logger.info("✍️  Content Writer: DeepSeek R1 Distill Llama 70B")
+        logger.info("📱 Social Media: written alongside the blog post")
+        logger.info("%s", "=" * 70)
         
         try:
-            # Create tasks for each agent
-            research_task = self.create_research_task(topic)
-            content_task = self.create_content_writing_task(topic)
-            social_task = self.create_social_media_task(topic)
-            
-            # Create multi-agent crew with sequential process
-            crew = Crew(
-                agents=[self.researcher, self.content_writer, self.social_media_specialist],
-                tasks=[research_task, content_task, social_task],
-                process=Process.sequential,  # Research -> Content -> Social
-                verbose=True,
-                max_rpm=3  # Conservative rate limiting
-            )
+            crew = self.get_crew()
             
-            print("⏱️  Starting multi-agent content creation...")
-            print("🔄 Phase 1: Research Agent gathering information...")
+            logger.info("⏱️  Starting multi-agent content creation...")
+            logger.info("🔄 Phase 1: Research Agent gathering information...")
             
-            # Execute the multi-agent workflow
-            results = crew.kickoff(inputs={"topic": topic})
+            results = await crew.kickoff_async(inputs={"topic": topic})
             
-            print("\n✅ Multi-agent content creation completed!")
+            research_result = results.tasks_output[0]
+            bundle_output = results.tasks_output[1]
+            bundle = parse_content_bundle(bundle_output)
+            
+            # Split the bundle client-side into the blog and social documents; if the JSON is unusable,
+            # keep the raw output rather than discarding the research that was already paid for
+            if bundle is not None:
+                content_result = bundle.blog_md
+                social_result = self.format_social_content(bundle)
+            else:
+                logger.warning("⚠️ Could not parse the blog + social JSON; saving the raw writer output instead")
+                content_result = bundle_output.raw
+                social_result = "⚠️ The social package could not be parsed; see the raw writer output in 02_technical_blog_post.md"
             
-            # Extract individual results (CrewAI returns results for each task)
-            research_result = results.tasks_output[0] if hasattr(results, 'tasks_output') else "Research completed"
-            content_result = results.tasks_output[1] if hasattr(results, 'tasks_output') else "Content completed"
-            social_result = results.tasks_output[2] if hasattr(results, 'tasks_output') else "Social media completed"
+            logger.info("\n✅ Multi-agent content creation completed!")
             
             # Save all content
             output_dir = self.save_content_to_files(topic, research_result, content_result, social_result)
@@ -524,13 +930,19 @@ class MultiAgentContentCreator:
             }
             
         except Exception as e:
-            print(f"\n❌ Error in multi-agent system: {str(e)}")
+            logger.error("\n❌ Error in multi-agent system: %s", e)
             raise e
 
+    def create_content(self, topic):
+        """Synchronous wrapper around create_content_async"""
+        return asyncio.run(self.create_content_async(topic))
+
 # ======================
 # Usage
 # ======================
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    
     print("🤖 AI-Powered Multi-Agent Content Creator")
     print("="*50)
     print("🔬 Research Agent: Qwen 3-32B")
@@ -574,7 +986,7 @@ if __name__ == "__main__":
         print("\n🤖 Agent Contributions:")
         print("🔬 **RESEARCH AGENT (Qwen 3-32B)**: Comprehensive research and data gathering")
         print("✍️  **CONTENT WRITER (DeepSeek R1)**: Technical blog post with practical insights")
-        print("📱 **SOCIAL SPECIALIST (DeepSeek R1)**: Engaging social media content")
+        print("📱 **SOCIAL CONTENT (DeepSeek R1)**: Engaging social media content, written with the blog")
         print("\n📝 What was created:")
         print("📊 **RESEARCH**: Academic papers, industry data, technical examples")
         print("🎯 **BLOG POST**: 1000-1500 words with code examples and real-world applications")
@@ -4,13 +4,27 @@ from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 from dotenv import load_dotenv
 import os
 import re
+import logging
+import bisect
+import hashlib
+import importlib.util
+import asyncio
+import aiofiles
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Type
-from pydantic import BaseModel, Field
+from typing import ClassVar, List, Optional, Type
+from pydantic import BaseModel, Field, PrivateAttr
 
 load_dotenv()
 
+# Debug output goes through logging so it costs nothing unless LOG_LEVEL=DEBUG
+# (the level is applied by the __main__ block; importers keep their own logging setup)
+logger = logging.getLogger(__name__)
+
 # ======================
 # Fixed Google Scholar Tool using Serper.dev API
 # ======================
@@ -19,32 +33,130 @@ class GoogleScholarSearchInput(BaseModel):
     query: str = Field(..., description="Search query for Google Scholar")
     years_back: int = Field(default=3, description="Number of years back to search (default: 3)")
 
+class GoogleScholarBatchSearchInput(BaseModel):
+    """Input schema for batched Google Scholar search via Serper.dev."""
+    queries: List[str] = Field(..., description="List of search queries for Google Scholar")
+    years_back: int = Field(default=3, description="Number of years back to search (default: 3)")
+
 class GoogleScholarTool(BaseTool):
     name: str = "google_scholar_search"
     description: str = "Search Google Scholar for academic papers and research publications using Serper.dev API."
     args_schema: Type[BaseModel] = GoogleScholarSearchInput
     
+    # Hoisted constants shared by every call
+    _URL: ClassVar[str] = "https://google.serper.dev/scholar"
+    _HEADERS_TEMPLATE: ClassVar[dict] = {'Content-Type': 'application/json'}
+    _YEAR_RE: ClassVar[re.Pattern] = re.compile(r'\b(20\d{2})\b')
+    
+    _api_key: Optional[str] = PrivateAttr(default=None)
+    _headers: dict = PrivateAttr(default_factory=dict)
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Resolve the API key once instead of on every call
+        self._api_key = os.getenv("SERPER_API_KEY")
+        self._headers = {**self._HEADERS_TEMPLATE, 'X-API-KEY': self._api_key}
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session, created lazily so TLS connections are reused across calls"""
+        if self._session is None:
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["POST"]),  # Scholar search is idempotent
+                raise_on_status=False
+            )
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        return self._session
+    
+    def _extract_snippet_years(self, snippets: List[str]) -> List[str]:
+        """Find the first year in each snippet with a single regex pass over all of them"""
+        # Join with a record separator the year pattern can never match across
+        joined = "\n\x1e".join(snippets)
+        
+        # Start offset of each record within the joined string
+        starts = []
+        offset = 0
+        for snippet in snippets:
+            starts.append(offset)
+            offset += len(snippet) + 2
+        
+        years = [""] * len(snippets)
+        for match in self._YEAR_RE.finditer(joined):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if not years[index]:
+                years[index] = match.group(1)
+        return years
+    
+    def _format_results(self, query: str, years_back: int, data: dict) -> str:
+        """Format a Serper.dev Scholar response, keeping results from the last `years_back` years"""
+        # Calculate year range
+        start_year = datetime.now().year - years_back
+        
+        # Check if we have results
+        if "organic" not in data or not data["organic"]:
+            return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
+        
+        results = data["organic"][:6]  # Top 6 results
+        snippet_years = self._extract_snippet_years([result.get("snippet", "") for result in results])
+        
+        # Format results
+        formatted_results = []
+        for result, snippet_year in zip(results, snippet_years):
+            title = result.get("title", "")
+            link = result.get("link", "")
+            snippet = result.get("snippet", "")
+            
+            # Extract publication info if available
+            publication_info = result.get("publicationInfo", {})
+            authors = publication_info.get("authors", "")
+            
+            # Extract year from publication info, falling back to the snippet
+            if publication_info and "year" in publication_info:
+                year = str(publication_info["year"])
+            else:
+                year = snippet_year
+            
+            # Get citation count if available
+            citations = 0
+            if "citedBy" in result:
+                citations = result["citedBy"].get("total", 0)
+            
+            # Format result
+            result_text = f"📄 **{title}**\n"
+            if link:
+                result_text += f"   Link: {link}\n"
+            if authors:
+                result_text += f"   Authors: {authors}\n"
+            if year:
+                result_text += f"   Year: {year}\n"
+            if citations > 0:
+                result_text += f"   Citations: {citations}\n"
+            if snippet:
+                result_text += f"   Abstract: {snippet}\n"
+            result_text += "\n"
+            
+            # Filter by year if specified and we found a year
+            if year and year.isdigit() and int(year) >= start_year:
+                formatted_results.append(result_text)
+            elif not year:  # Include results without clear year info
+                formatted_results.append(result_text)
+        
+        if formatted_results:
+            return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n" + "\n".join(formatted_results)
+        else:
+            return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
+    
     def _run(self, query: str, years_back: int = 3) -> str:
         """Search Google Scholar using Serper.dev API"""
         try:
-            # Get API key
-            api_key = os.getenv("SERPER_API_KEY")
-            if not api_key:
+            if not self._api_key:
                 return "❌ SERPER_API_KEY not found in environment variables"
             
-            # Calculate year range
-            current_year = datetime.now().year
-            start_year = current_year - years_back
-            
-            # Serper.dev API endpoint for Google Scholar
-            url = "https://google.serper.dev/scholar"
-            
-            # Headers for Serper.dev
-            headers = {
-                'X-API-KEY': api_key,
-                'Content-Type': 'application/json'
-            }
-            
             # Payload for Serper.dev Scholar API
             payload = {
                 "q": query,
@@ -53,67 +165,14 @@ class GoogleScholarTool(BaseTool):
             }
             
             # Make API request
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = self.session.post(self._URL, headers=self._headers, data=orjson.dumps(payload), timeout=10)
             
             if response.status_code != 200:
                 return f"❌ API request failed with status {response.status_code}: {response.text}"
             
-            data = response.json()
-            
-            # Check if we have results
-            if "organic" not in data or not data["organic"]:
-                return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
+            data = orjson.loads(response.content)
             
-            # Format results
-            formatted_results = []
-            for result in data["organic"][:6]:  # Top 6 results
-                title = result.get("title", "")
-                link = result.get("link", "")
-                snippet = result.get("snippet", "")
-                
-                # Extract publication info if available
-                publication_info = result.get("publicationInfo", {})
-                authors = publication_info.get("authors", "")
-                
-                # Extract year from snippet or publication info
-                year = ""
-                if publication_info and "year" in publication_info:
-                    year = str(publication_info["year"])
-                elif snippet:
-                    # Try to extract year from snippet (common format: "- 2023 - ...")
-                    year_match = re.search(r'\b(20\d{2})\b', snippet)
-                    if year_match:
-                        year = year_match.group(1)
-                
-                # Get citation count if available
-                citations = 0
-                if "citedBy" in result:
-                    citations = result["citedBy"].get("total", 0)
-                
-                # Format result
-                result_text = f"📄 **{title}**\n"
-                if link:
-                    result_text += f"   Link: {link}\n"
-                if authors:
-                    result_text += f"   Authors: {authors}\n"
-                if year:
-                    result_text += f"   Year: {year}\n"
-                if citations > 0:
-                    result_text += f"   Citations: {citations}\n"
-                if snippet:
-                    result_text += f"   Abstract: {snippet}\n"
-                result_text += "\n"
-                
-                # Filter by year if specified and we found a year
-                if year and year.isdigit() and int(year) >= start_year:
-                    formatted_results.append(result_text)
-                elif not year:  # Include results without clear year info
-                    formatted_results.append(result_text)
-            
-            if formatted_results:
-                return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n" + "\n".join(formatted_results)
-            else:
-                return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
+            return self._format_results(query, years_back, data)
                 
         except requests.exceptions.Timeout:
             return "❌ Google Scholar search timed out. Try again."
@@ -122,6 +181,52 @@ class GoogleScholarTool(BaseTool):
         except Exception as e:
             return f"❌ Google Scholar search failed: {str(e)}"
 
+class GoogleScholarBatchTool(GoogleScholarTool):
+    name: str = "google_scholar_batch_search"
+    description: str = "Search Google Scholar for several queries at once (runs them concurrently) using Serper.dev API."
+    args_schema: Type[BaseModel] = GoogleScholarBatchSearchInput
+    
+    async def _fetch_one(self, session: aiohttp.ClientSession, query: str, years_back: int) -> str:
+        """Run a single Scholar query on the shared aiohttp session"""
+        try:
+            payload = {
+                "q": query,
+                "num": 6,  # Number of results
+                "hl": "en"  # Language
+            }
+            async with session.post(self._URL, data=orjson.dumps(payload)) as response:
+                if response.status != 200:
+                    return f"❌ API request failed with status {response.status}: {await response.text()}"
+                data = orjson.loads(await response.read())
+            
+            return self._format_results(query, years_back, data)
+            
+        except asyncio.TimeoutError:
+            return f"❌ Google Scholar search timed out for '{query}'. Try again."
+        except aiohttp.ClientError as e:
+            return f"❌ Network error during Google Scholar search for '{query}': {str(e)}"
+    
+    async def _run_batch(self, queries: List[str], years_back: int) -> List[str]:
+        """Fan out all queries concurrently over one session so TLS + DNS are amortized"""
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(headers=self._headers, timeout=timeout) as session:
+            return await asyncio.gather(*(self._fetch_one(session, q, years_back) for q in queries))
+    
+    def _run(self, queries: List[str], years_back: int = 3) -> str:
+        """Search Google Scholar for multiple queries using Serper.dev API"""
+        try:
+            if not self._api_key:
+                return "❌ SERPER_API_KEY not found in environment variables"
+            
+            if not queries:
+                return "🔬 No queries provided for Google Scholar batch search."
+            
+            results = asyncio.run(self._run_batch(queries, years_back))
+            return "\n\n---\n\n".join(results)
+            
+        except Exception as e:
+            return f"❌ Google Scholar batch search failed: {str(e)}"
+
 # ======================
 # LLM Configuration
 # ======================
@@ -132,52 +237,229 @@ llm = LLM(
     max_tokens=4000
 )
 
+# ======================
+# Output Section Parsing
+# ======================
+SECTION_NAMES = ("BLOG POST", "LINKEDIN POSTS", "X/TWITTER POSTS", "MIDJOURNEY PROMPTS")
+# Matched against the UTF-8 encoded content, so every offset is a byte offset. Models often add a
+# suffix ("# BLOG POST: <title>", "# BLOG POST (1200 words)"): it is allowed and left out of the body
+SECTION_RE = re.compile(rb'^# (BLOG POST|LINKEDIN POSTS|X/TWITTER POSTS|MIDJOURNEY PROMPTS)(?:(?:[ \t:(\-]|\xe2\x80\x94).*)?$', re.MULTILINE)
+
+# Split files: (key, filename, min chars to save, file header template, message when missing)
+SECTION_FILES = (
+    ("blog", "technical_blog_post.md", 100,
+     "# {topic}\n\n*Technical blog post from a data scientist's perspective*\n*Generated: {generated}*\n\n",
+     "❌ Could not extract blog post - check complete_technical_content.md for raw output"),
+    ("social", "social_media_posts.md", 50,
+     "# Social Media Content: {topic}\n\n*Generated: {generated}*\n\n",
+     "⚠️  Could not extract social media content"),
+    ("midjourney", "midjourney_prompts.md", 30,
+     "# MidJourney Prompts: {topic}\n\n*Generated: {generated}*\n\n",
+     "⚠️  Could not extract MidJourney prompts content"),
+)
+
+# README blocks: (created, not extracted) line per split file, then the fixed text
+README_FILE_LINES = {
+    "blog": ("- ✅ `technical_blog_post.md` - **MAIN TECHNICAL BLOG** (1000-1500 words)\n",
+             "- ❌ `technical_blog_post.md` - Main technical blog (not extracted)\n"),
+    "social": ("- ✅ `social_media_posts.md` - LinkedIn & Twitter content\n",
+               "- ❌ `social_media_posts.md` - Social media content (not extracted)\n"),
+    "midjourney": ("- ✅ `midjourney_prompts.md` - MidJourney visual prompts\n",
+                   "- ❌ `midjourney_prompts.md` - MidJourney prompts (not extracted)\n"),
+}
+README_STATIC = (
+    "- ✅ `complete_technical_content.md` - All content including social media\n"
+    "- ✅ `README.md` - This file\n\n"
+    "## 🔬 Content Features:\n\n"
+    "✅ Technical depth with practical implementation\n"
+    "✅ Code examples and technical details\n"
+    "✅ Personal insights from data science experience\n"
+    "✅ Real-world applications and challenges\n"
+    "✅ Technical social media content\n"
+    "✅ MidJourney prompts for professional blog visuals\n"
+)
+README_EXTRACTION_ISSUES = (
+    "\n## ⚠️ Extraction Issues:\n\n"
+    "Some content sections couldn't be extracted. Check `complete_technical_content.md` for the full output.\n"
+    "The content might be there but not properly formatted with the expected headers.\n"
+)
+
+# Deletion table for directory-safe topic slugs (str.translate runs in C)
+_SLUG_TRANS = str.maketrans("", "", "".join(chr(i) for i in range(256) if not (chr(i).isalnum() or chr(i) in " -_")))
+
+# Optional JIT header scan for MB-scale outputs: USE_NUMBA_PARSER=1 (pip install numba)
+# numba/llvmlite are only imported when opted in, so default runs skip their import cost
+USE_NUMBA_PARSER = os.getenv("USE_NUMBA_PARSER", "0") == "1"
+NUMBA_AVAILABLE = False
+if USE_NUMBA_PARSER:
+    try:
+        import numpy as np
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)  # cache=True: later runs skip the compile
+    def _scan_section_headers(buf, needles_flat, needle_offsets):
+        """Rows of (header_start, header_end, needle index) for lines that are a needle plus an optional suffix (same rule as SECTION_RE)"""
+        n = buf.shape[0]
+        lines = 1
+        for i in range(n):
+            if buf[i] == 10:
+                lines += 1
+        out = np.empty((lines, 3), np.int64)
+        count = 0
+        
+        i = 0
+        while i < n:
+            # i is always a line start here
+            for k in range(needle_offsets.shape[0] - 1):
+                start = needle_offsets[k]
+                length = needle_offsets[k + 1] - start
+                if i + length > n:
+                    continue
+                matched = True
+                for j in range(length):
+                    if buf[i + j] != needles_flat[start + j]:
+                        matched = False
+                        break
+                if matched:
+                    end = i + length
+                    # Suffix starts with space, tab, ':', '(', '-' or an em dash (UTF-8 e2 80 94)
+                    suffix = end < n and (buf[end] == 32 or buf[end] == 9 or buf[end] == 58 or buf[end] == 40 or buf[end] == 45
+                                          or (buf[end] == 0xE2 and end + 2 < n and buf[end + 1] == 0x80 and buf[end + 2] == 0x94))
+                    if suffix:
+                        while end < n and buf[end] != 10:
+                            end += 1
+                    if end == n or buf[end] == 10:
+                        out[count, 0] = i
+                        out[count, 1] = end
+                        out[count, 2] = k
+                        count += 1
+                        break
+            
+            # Skip to the next line start
+            while i < n and buf[i] != 10:
+                i += 1
+            i += 1
+        return out[:count]
+    
+    # UTF-8 bytes, same offsets as the regex path
+    _NEEDLES = [np.frombuffer(f"# {name}".encode("utf-8"), dtype=np.uint8) for name in SECTION_NAMES]
+    _NEEDLES_FLAT = np.concatenate(_NEEDLES)
+    _NEEDLE_OFFSETS = np.cumsum([0] + [len(needle) for needle in _NEEDLES]).astype(np.int64)
+
+def _section_header_matches(content_bytes):
+    """(header_start, header_end, section name) for every section header line"""
+    if NUMBA_AVAILABLE:
+        buf = np.frombuffer(content_bytes, dtype=np.uint8)  # zero-copy view
+        rows = _scan_section_headers(buf, _NEEDLES_FLAT, _NEEDLE_OFFSETS)
+        return [(int(start), int(end), SECTION_NAMES[k]) for start, end, k in rows]
+    return [(m.start(), m.end(), m.group(1).decode("ascii")) for m in SECTION_RE.finditer(content_bytes)]
+
+def find_sections(content_bytes):
+    """Map each section name to (header_start, body_start, section_end) byte offsets in one pass"""
+    matches = _section_header_matches(content_bytes)
+    sections = {}
+    for i, (header_start, body_start, name) in enumerate(matches):
+        section_end = matches[i + 1][0] if i + 1 < len(matches) else len(content_bytes)
+        sections.setdefault(name, (header_start, body_start, section_end))  # First occurrence wins
+    return sections
+
+def section_spans(sections, content_len):
+    """(start, end) byte offsets of each split-file section, keyed like SECTION_FILES"""
+    spans = {}
+    if "BLOG POST" in sections:
+        # Blog body (without its header) runs up to whichever section header comes next
+        _, start, end = sections["BLOG POST"]
+        spans["blog"] = (start, end)
+    if "LINKEDIN POSTS" in sections:
+        start, _, end = sections["LINKEDIN POSTS"]
+        # If the X/TWITTER section follows directly, include it in social media
+        twitter = sections.get("X/TWITTER POSTS")
+        if twitter and twitter[0] == end:
+            end = twitter[2]
+        spans["social"] = (start, end)
+    if "MIDJOURNEY PROMPTS" in sections:
+        spans["midjourney"] = (sections["MIDJOURNEY PROMPTS"][0], content_len)
+    return spans
+
+# ======================
+# Topic Content Cache
+# ======================
+# Optional: pip install diskcache (+ sentence-transformers faiss-cpu for near-identical topics)
+CONTENT_CACHE_DIR = "./.content_cache"
+CONTENT_CACHE_TTL = 24 * 3600
+
+try:
+    import diskcache
+    CONTENT_CACHE_AVAILABLE = True
+except ImportError:
+    CONTENT_CACHE_AVAILABLE = False
+
+# Probed, not imported: torch/transformers load only when a ContentTemplateCache is built
+SEMANTIC_TOPIC_MATCH_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("faiss", "sentence_transformers")
+)
+
+class ContentTemplateCache:
+    """Full crew output cached per topic fingerprint, so repeated topics skip crew.kickoff"""
+    
+    def __init__(self, cache_dir=CONTENT_CACHE_DIR, ttl=CONTENT_CACHE_TTL, threshold=0.95):
+        self.store = diskcache.Cache(cache_dir)
+        self.ttl = ttl
+        self.threshold = threshold
+        self.model = None
+        self.index = None
+        self.keys = []  # diskcache keys, aligned with index ids
+        
+        if SEMANTIC_TOPIC_MATCH_AVAILABLE:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+            
+            self.model = SentenceTransformer("all-MiniLM-L6-v2")
+            self.index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+            
+            # Re-index the topics still on disk in one batched encode
+            entries = [(key, self.store.get(key)) for key in self.store.iterkeys()]
+            entries = [(key, entry) for key, entry in entries if entry is not None]
+            if entries:
+                self.index.add(self._embed([entry["topic"] for _, entry in entries]))
+                self.keys = [key for key, _ in entries]
+    
+    @staticmethod
+    def topic_key(topic):
+        return hashlib.blake2b(topic.lower().strip().encode("utf-8")).hexdigest()
+    
+    def _embed(self, topics):
+        return self.model.encode(topics, normalize_embeddings=True, convert_to_numpy=True).astype("float32")
+    
+    def get(self, topic):
+        """Cached content for this topic (or a near-identical one), or None"""
+        entry = self.store.get(self.topic_key(topic))
+        if entry is None and self.index is not None and self.index.ntotal:
+            scores, ids = self.index.search(self._embed([topic]), 1)
+            if ids[0][0] >= 0 and scores[0][0] >= self.threshold:
+                entry = self.store.get(self.keys[ids[0][0]])  # None once expired
+        return entry["content"] if entry else None
+    
+    def set(self, topic, content):
+        key = self.topic_key(topic)
+        self.store.set(key, {"topic": topic, "content": content}, expire=self.ttl)
+        if self.index is not None:
+            self.index.add(self._embed([topic]))
+            self.keys.append(key)
+
 # ======================
 # Main Content Creator Class
 # ======================
 class DataScienceContentCreator:
     """Content creator for data scientists - technical, personal, practical"""
     
-    def __init__(self):
-        # Initialize Google Scholar tool
-        self.scholar_tool = GoogleScholarTool()
-        
-        # Data Science focused agent with both Google and Scholar search
-        self.content_creator = Agent(
-            role="Senior Data Scientist & Technical Writer",
-            goal="Create in-depth, technical blog posts about '{topic}' from a data scientist's perspective, using both academic research and practical implementations.",
-            backstory="""You are a seasoned data scientist with 10+ years of experience in machine learning, 
-            statistical analysis, and data engineering. You write technical blog posts that combine theoretical 
-            knowledge with practical implementation. Your writing style is:
-            
-            - Technical but accessible to fellow data scientists
-            - Combines academic research with practical implementation
-            - Includes code examples and mathematical concepts
-            - Shares real-world challenges and solutions
-            - Focuses on practical implementation over marketing hype
-            - Uses personal anecdotes from data science projects
-            - References both academic papers and industry best practices
-            - Explains complex concepts with data-driven examples
-            - Discusses tools, frameworks, and methodologies
-            
-            You have access to both regular web search and Google Scholar search. Use Scholar 
-            to find academic research, papers, and theoretical foundations. Use regular web search 
-            to find practical implementations, tutorials, and industry applications.
-            
-            You avoid marketing buzzwords and focus on substance, sharing genuine insights 
-            that would help other data scientists in their work.""",
-            tools=[SerperDevTool(), ScrapeWebsiteTool()],  # Removed scholar_tool temporarily
-            llm=llm,
-            verbose=True,
-            max_iter=3,  # Allow more iterations to use tools
-            max_rpm=5,   # Higher rate limit
-            allow_delegation=False,
-            step_callback=None
-        )
-
-    def create_technical_content(self, topic):
-        task = Task(
-            description=f"""
+    # Static prompt template: CrewAI fills {topic} from kickoff inputs, so the prompt prefix
+    # stays identical across runs; search results only ever arrive as tool-call messages
+    _TECHNICAL_DESC = """
             Create a technical content package about: '{topic}' from a data scientist's perspective.
             
             🎯 PRIMARY DELIVERABLE - TECHNICAL BLOG POST:
@@ -252,201 +534,183 @@ class DataScienceContentCreator:
             
             # MIDJOURNEY PROMPTS
             [3 detailed MidJourney prompts for technical blog visuals with --ar and --v parameters]
-            """,
+            """
+    
+    def __init__(self):
+        # Initialize Google Scholar tools
+        self.scholar_tool = GoogleScholarTool()
+        self.scholar_batch_tool = GoogleScholarBatchTool()
+        
+        # CrewAI's verbose mode prints every step to stdout; opt in with CREWAI_VERBOSE=1
+        self._verbose = os.getenv("CREWAI_VERBOSE", "0") == "1"
+        
+        # Repeated topics are served from disk instead of re-running the whole crew
+        self.content_cache = ContentTemplateCache() if CONTENT_CACHE_AVAILABLE else None
+        
+        # Data Science focused agent with both Google and Scholar search
+        self.content_creator = Agent(
+            role="Senior Data Scientist & Technical Writer",
+            goal="Create in-depth, technical blog posts about '{topic}' from a data scientist's perspective, using both academic research and practical implementations.",
+            backstory="""You are a seasoned data scientist with 10+ years of experience in machine learning, 
+            statistical analysis, and data engineering. You write technical blog posts that combine theoretical 
+            knowledge with practical implementation. Your writing style is:
+            
+            - Technical but accessible to fellow data scientists
+            - Combines academic research with practical implementation
+            - Includes code examples and mathematical concepts
+            - Shares real-world challenges and solutions
+            - Focuses on practical implementation over marketing hype
+            - Uses personal anecdotes from data science projects
+            - References both academic papers and industry best practices
+            - Explains complex concepts with data-driven examples
+            - Discusses tools, frameworks, and methodologies
+            
+            You have access to both regular web search and Google Scholar search. Use Scholar 
+            to find academic research, papers, and theoretical foundations. Use regular web search 
+            to find practical implementations, tutorials, and industry applications.
+            
+            You avoid marketing buzzwords and focus on substance, sharing genuine insights 
+            that would help other data scientists in their work.""",
+            tools=[SerperDevTool(), ScrapeWebsiteTool(), self.scholar_batch_tool],  # Batch tool: all Scholar queries in one step
+            llm=llm,
+            verbose=self._verbose,
+            max_iter=3,  # Allow more iterations to use tools
+            max_rpm=5,   # Higher rate limit
+            allow_delegation=False,
+            step_callback=None
+        )
+
+    def create_technical_content(self, topic):
+        """Task for the content package; {topic} is filled in from the kickoff inputs"""
+        task = Task(
+            description=self._TECHNICAL_DESC,
             expected_output="Technical content package written from data scientist's perspective with practical insights and implementation details",
             agent=self.content_creator
         )
         return task
 
-    def save_content_to_files(self, topic, content):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+    @staticmethod
+    async def _write_file_async(path, payload):
+        """Write bytes via aiofiles' thread pool so the event loop isn't blocked"""
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(payload)
+
+    async def save_content_to_files_async(self, topic, content):
+        # Resolve the timestamp once for the directory name and every file header
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated = now.strftime('%Y-%m-%d %H:%M:%S')
+        safe_topic = topic.translate(_SLUG_TRANS).rstrip()[:50]
         output_dir = f"technical_content/{safe_topic}_{timestamp}"
         os.makedirs(output_dir, exist_ok=True)
         
         print(f"\n💾 Saving technical content to: {output_dir}")
         
-        # Get content as string
+        # Encode once; sections are sliced out of a memoryview and written as bytes
         content_str = str(content)
+        content_bytes = content_str.encode("utf-8")
+        view = memoryview(content_bytes)
         
-        # Debug: Show what we're working with
-        print(f"🔍 DEBUG: Content length: {len(content_str)} characters")
-        print(f"🔍 DEBUG: Looking for '# BLOG POST' in content...")
-        print(f"🔍 DEBUG: Contains '# BLOG POST': {'# BLOG POST' in content_str}")
-        print(f"🔍 DEBUG: Contains '# LINKEDIN POSTS': {'# LINKEDIN POSTS' in content_str}")
-        print(f"🔍 DEBUG: Contains '# MIDJOURNEY PROMPTS': {'# MIDJOURNEY PROMPTS' in content_str}")
-        print(f"🔍 DEBUG: First 300 characters:\n{content_str[:300]}")
+        # Locate every section header once
+        sections = find_sections(content_bytes)
         
-        # Save complete content
-        with open(f"{output_dir}/complete_technical_content.md", "w", encoding="utf-8") as f:
-            f.write(f"# Technical Content Package: {topic}\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Perspective:** Data Scientist Technical Blog\n")
-            f.write(f"**Model:** DeepSeek R1 Distill Llama 70B\n\n")
-            f.write("---\n\n")
-            f.write(content_str)
-        print("✅ Saved: complete_technical_content.md")
+        # Debug: Show what we're working with (LOG_LEVEL=DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Content length: %d characters", len(content_str))
+            logger.debug("🔍 Sections found: %s", ", ".join(sections) or "none")
+            logger.debug("🔍 First 300 characters:\n%s", content_str[:300])
         
-        # Extract blog post with improved logic
-        blog_extracted = False
-        if "# BLOG POST" in content_str:
-            blog_start = content_str.find("# BLOG POST") + len("# BLOG POST")
-            
-            # Try multiple end markers in order of preference
-            end_markers = ["# LINKEDIN POSTS", "# X/TWITTER POSTS", "# MIDJOURNEY PROMPTS"]
-            blog_end = len(content_str)  # Default to end of content
-            
-            for marker in end_markers:
-                marker_pos = content_str.find(marker)
-                if marker_pos > blog_start:  # Make sure it's after the blog start
-                    blog_end = marker_pos
-                    break
-            
-            blog_content = content_str[blog_start:blog_end].strip()
-            
-            # Only save if we have substantial content
-            if len(blog_content) > 100:
-                with open(f"{output_dir}/technical_blog_post.md", "w", encoding="utf-8") as f:
-                    f.write(f"# {topic}\n\n")
-                    f.write(f"*Technical blog post from a data scientist's perspective*\n")
-                    f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                    f.write(blog_content)
-                print("✅ Saved: technical_blog_post.md")
-                blog_extracted = True
-            else:
-                print(f"⚠️  Blog content too short ({len(blog_content)} chars), not saving separate file")
+        # Collect (path, payload) pairs; everything is written concurrently once extraction is done
+        writes = []
         
-        if not blog_extracted:
-            print("❌ Could not extract blog post - check complete_technical_content.md for raw output")
+        # Complete content
+        complete_header = (
+            f"# Technical Content Package: {topic}\n\n"
+            f"**Generated:** {generated}\n"
+            f"**Perspective:** Data Scientist Technical Blog\n"
+            f"**Model:** DeepSeek R1 Distill Llama 70B\n\n"
+            "---\n\n"
+        ).encode("utf-8")
+        writes.append((f"{output_dir}/complete_technical_content.md", complete_header + content_bytes))
         
-        # Extract social media content
-        social_extracted = False
-        if "# LINKEDIN POSTS" in content_str:
-            social_start = content_str.find("# LINKEDIN POSTS")
-            
-            # Find end of social section
-            end_markers = ["# X/TWITTER POSTS", "# MIDJOURNEY PROMPTS"]
-            social_end = len(content_str)
-            
-            for marker in end_markers:
-                marker_pos = content_str.find(marker, social_start + 1)
-                if marker_pos > social_start:
-                    social_end = marker_pos
-                    break
-            
-            # If we found X/TWITTER section, include it in social media
-            if "# X/TWITTER POSTS" in content_str:
-                twitter_start = content_str.find("# X/TWITTER POSTS")
-                if twitter_start < social_end or social_end == len(content_str):
-                    # Include Twitter section
-                    midjourney_start = content_str.find("# MIDJOURNEY PROMPTS")
-                    if midjourney_start > twitter_start:
-                        social_end = midjourney_start
-                    else:
-                        social_end = len(content_str)
-            
-            social_content = content_str[social_start:social_end].strip()
-            
-            if len(social_content) > 50:
-                with open(f"{output_dir}/social_media_posts.md", "w", encoding="utf-8") as f:
-                    f.write(f"# Social Media Content: {topic}\n\n")
-                    f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                    f.write(social_content)
-                print("✅ Saved: social_media_posts.md")
-                social_extracted = True
+        # One pass over the section table: slice, validate, queue the write
+        spans = section_spans(sections, len(content_bytes))
+        extracted = {}
+        for key, filename, min_chars, header, missing_msg in SECTION_FILES:
+            extracted[key] = False
+            if key in spans:
+                start, end = spans[key]
+                section_content = bytes(view[start:end]).strip()
+                section_chars = len(section_content.decode("utf-8"))  # min_chars counts characters, not UTF-8 bytes
+                
+                # Only save if we have substantial content
+                if section_chars > min_chars:
+                    writes.append((f"{output_dir}/{filename}", header.format(topic=topic, generated=generated).encode("utf-8") + section_content))
+                    extracted[key] = True
+                elif key == "blog":
+                    print(f"⚠️  Blog content too short ({section_chars} characters), not saving separate file")
+            
+            if not extracted[key]:
+                print(missing_msg)
         
-        if not social_extracted:
-            print("⚠️  Could not extract social media content")
+        # Create README for technical content
+        files_created = 1 + sum(extracted.values())  # complete_technical_content.md always created
         
-        # Extract MidJourney prompts
-        midjourney_extracted = False
-        if "# MIDJOURNEY PROMPTS" in content_str:
-            midjourney_start = content_str.find("# MIDJOURNEY PROMPTS")
-            midjourney_content = content_str[midjourney_start:].strip()
-            
-            if len(midjourney_content) > 30:
-                with open(f"{output_dir}/midjourney_prompts.md", "w", encoding="utf-8") as f:
-                    f.write(f"# MidJourney Prompts: {topic}\n\n")
-                    f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                    f.write(midjourney_content)
-                print("✅ Saved: midjourney_prompts.md")
-                midjourney_extracted = True
+        readme = [
+            f"# Technical Content: {topic}\n\n",
+            f"**Generated:** {generated}\n",
+            f"**Style:** Data Scientist Technical Perspective\n",
+            f"**Success Rate:** {files_created}/5 files created\n\n",
+            "## 📁 Files:\n\n",
+        ]
         
-        if not midjourney_extracted:
-            print("⚠️  Could not extract MidJourney prompts content")
+        # List files that were actually created; the static blocks are prebuilt module constants
+        readme.extend(README_FILE_LINES[key][0 if extracted[key] else 1] for key, *_ in SECTION_FILES)
+        readme.append(README_STATIC)
+        if files_created < 4:
+            readme.append(README_EXTRACTION_ISSUES)
         
-        # Create README for technical content
-        files_created = 1  # complete_technical_content.md always created
-        if blog_extracted:
-            files_created += 1
-        if social_extracted:
-            files_created += 1
-        if midjourney_extracted:
-            files_created += 1
+        writes.append((f"{output_dir}/README.md", "".join(readme).encode("utf-8")))
         
-        with open(f"{output_dir}/README.md", "w", encoding="utf-8") as f:
-            f.write(f"# Technical Content: {topic}\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Style:** Data Scientist Technical Perspective\n")
-            f.write(f"**Success Rate:** {files_created}/5 files created\n\n")
-            f.write("## 📁 Files:\n\n")
-            
-            # List files that were actually created
-            if blog_extracted:
-                f.write("- ✅ `technical_blog_post.md` - **MAIN TECHNICAL BLOG** (1000-1500 words)\n")
-            else:
-                f.write("- ❌ `technical_blog_post.md` - Main technical blog (not extracted)\n")
-                
-            if social_extracted:
-                f.write("- ✅ `social_media_posts.md` - LinkedIn & Twitter content\n")
-            else:
-                f.write("- ❌ `social_media_posts.md` - Social media content (not extracted)\n")
-                
-            if midjourney_extracted:
-                f.write("- ✅ `midjourney_prompts.md` - MidJourney visual prompts\n")
-            else:
-                f.write("- ❌ `midjourney_prompts.md` - MidJourney prompts (not extracted)\n")
-                
-            f.write("- ✅ `complete_technical_content.md` - All content including social media\n")
-            f.write("- ✅ `README.md` - This file\n\n")
-            
-            f.write("## 🔬 Content Features:\n\n")
-            f.write("✅ Technical depth with practical implementation\n")
-            f.write("✅ Code examples and technical details\n")
-            f.write("✅ Personal insights from data science experience\n")
-            f.write("✅ Real-world applications and challenges\n")
-            f.write("✅ Technical social media content\n")
-            f.write("✅ MidJourney prompts for professional blog visuals\n")
-            
-            if files_created < 4:
-                f.write(f"\n## ⚠️ Extraction Issues:\n\n")
-                f.write("Some content sections couldn't be extracted. Check `complete_technical_content.md` for the full output.\n")
-                f.write("The content might be there but not properly formatted with the expected headers.\n")
+        # Independent files: gather the writes so their latencies overlap
+        await asyncio.gather(*(self._write_file_async(path, payload) for path, payload in writes))
         
-        print("✅ Saved: README.md")
+        for path, _ in writes:
+            print(f"✅ Saved: {os.path.basename(path)}")
         print(f"📊 Successfully created {files_created}/5 files")
         
         return output_dir
 
+    def save_content_to_files(self, topic, content):
+        """Synchronous wrapper for callers without an event loop"""
+        return asyncio.run(self.save_content_to_files_async(topic, content))
+
     def create_content(self, topic):
         print(f"\n🔬 Creating technical content for: '{topic}'")
         print("🎯 Data scientist perspective with technical depth...")
         print("="*60)
         
         try:
-            task = self.create_technical_content(topic)
-            
-            crew = Crew(
-                agents=[self.content_creator],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=True,
-                max_rpm=2
-            )
-            
-            print("⏱️  Starting technical content creation...")
-            result = crew.kickoff(inputs={"topic": topic})
-            print("\n✅ Technical content creation completed!")
+            result = self.content_cache.get(topic) if self.content_cache else None
+            if result is not None:
+                print("⚡ Cache hit: reusing content generated for this topic in the last 24h")
+            else:
+                task = self.create_technical_content(topic)
+                
+                crew = Crew(
+                    agents=[self.content_creator],
+                    tasks=[task],
+                    process=Process.sequential,
+                    verbose=self._verbose,
+                    max_rpm=2
+                )
+                
+                print("⏱️  Starting technical content creation...")
+                result = crew.kickoff(inputs={"topic": topic})
+                print("\n✅ Technical content creation completed!")
+                
+                if self.content_cache:
+                    self.content_cache.set(topic, str(result))
             
             output_dir = self.save_content_to_files(topic, result)
             
@@ -463,6 +727,12 @@ class DataScienceContentCreator:
 # Usage
 # ======================
 if __name__ == "__main__":
+    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+    if not isinstance(logging.getLevelName(log_level), int):  # unknown names map to "Level X" strings
+        print(f"⚠️  Unknown LOG_LEVEL '{log_level}', using INFO")
+        log_level = "INFO"
+    logging.basicConfig(level=log_level, format="%(message)s")
+    
     creator = DataScienceContentCreator()
     
     # Example technical topics for data scientists
@@ -1,26 +1,43 @@
 import streamlit as st
 import os
+import sys
 import tempfile
 import zipfile
 from datetime import datetime
 
-# Fix for Streamlit Cloud SQLite3 issue
-try:
-    import sqlite3
-    # Check if we need to use pysqlite3-binary
-    if sqlite3.sqlite_version_info < (3, 35, 0):
-        import pysqlite3
-        import sys
-        sys.modules['sqlite3'] = pysqlite3
-except ImportError:
-    pass
+# Fix for Streamlit Cloud SQLite3 issue (skipped on script reruns once the shim is in place)
+if "pysqlite3" not in sys.modules:
+    try:
+        import sqlite3
+        # Check if we need to use pysqlite3-binary
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            import pysqlite3
+            sys.modules['sqlite3'] = pysqlite3
+    except ImportError:
+        pass
 
-from crewai import Agent, Crew, Process, Task, LLM
-from crewai.tools import BaseTool
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
+# CrewAI (chromadb, onnxruntime, litellm) is imported lazily so the page renders before the ML stack loads
+import io
 import re
+import csv
+import time
+import asyncio
+import pathlib
+import importlib.util
+import hashlib
+import functools
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import httpx
+import orjson
 import requests
-from typing import Type
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, stop_after_delay, wait_random_exponential
+from typing import List, Type
 from pydantic import BaseModel, Field
 
 # ======================
@@ -31,172 +48,716 @@ class GoogleScholarSearchInput(BaseModel):
     query: str = Field(..., description="Search query for Google Scholar")
     years_back: int = Field(default=3, description="Number of years back to search (default: 3)")
 
-class GoogleScholarTool(BaseTool):
-    name: str = "google_scholar_search"
-    description: str = "Search Google Scholar for academic papers and research publications using Serper.dev API."
-    args_schema: Type[BaseModel] = GoogleScholarSearchInput
+class SerperAPIError(Exception):
+    """Serper.dev returned a non-200 response (never cached)"""
+
+class TransientAPIError(Exception):
+    """Retryable HTTP status (429/5xx) from an upstream API, with its Retry-After hint if any"""
+    
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+TRANSIENT_STATUS = (429, 500, 502, 503, 504)
+_jittered_backoff = wait_random_exponential(min=0.5, max=8)
+
+def wait_retry_after(retry_state):
+    """Honor a Retry-After hint when the error carries one (capped at 30s), else jittered exponential backoff"""
+    exc = retry_state.outcome.exception()
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        retry_after = headers.get("retry-after")
+    try:
+        return min(float(retry_after), 30.0)
+    except (TypeError, ValueError):
+        return _jittered_backoff(retry_state)
+
+def is_transient_llm_error(exc):
+    """Rate limits, overloads and dropped connections from Groq (via litellm) are worth retrying"""
+    import litellm
+    
+    return isinstance(exc, (litellm.RateLimitError, litellm.ServiceUnavailableError, litellm.APIConnectionError, litellm.Timeout))
+
+# Per-process circuit breaker around Groq calls (optional: pip install pybreaker)
+try:
+    import pybreaker
+except ImportError:
+    pybreaker = None
+
+@st.cache_resource
+def get_groq_breaker():
+    """Opens after 5 consecutive transient Groq failures and fails fast for 30s instead of burning retries"""
+    if pybreaker is None:
+        return None
+    return pybreaker.CircuitBreaker(fail_max=5, reset_timeout=30, exclude=[lambda e: not is_transient_llm_error(e)])
+
+# Exact-key Scholar cache persisted across Streamlit sessions (optional: pip install diskcache)
+SCHOLAR_CACHE_TTL = 7 * 24 * 3600  # Scholar results for a fixed query are stable over days
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+_scholar_disk_cache = diskcache.Cache("./.scholar_cache") if diskcache else None
+
+# Semantic second tier so paraphrased queries reuse results (optional: pip install sentence-transformers faiss-cpu)
+# Probed, not imported: torch/transformers load only inside the cached factory below
+SEMANTIC_CACHE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("faiss", "sentence_transformers")
+)
+
+class SemanticSerperCache:
+    """Embedding-similarity cache over past Scholar queries"""
+    
+    def __init__(self, threshold=0.92, model_name="all-MiniLM-L6-v2"):
+        import faiss
+        from sentence_transformers import SentenceTransformer
+        
+        self.threshold = threshold
+        self.model = SentenceTransformer(model_name)
+        # Inner product over L2-normalized vectors == cosine similarity
+        self.index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+        self.rows = []  # (query, years_back, response), aligned with index ids
+        self._lock = threading.Lock()
+    
+    def embed(self, query):
+        return self.model.encode([query], normalize_embeddings=True, convert_to_numpy=True).astype("float32")
+    
+    def lookup(self, query, years_back):
+        """Return (cached response or None, query embedding)"""
+        embedding = self.embed(query)
+        with self._lock:
+            if self.index.ntotal:
+                # Look at a few neighbours since years_back must match too
+                scores, ids = self.index.search(embedding, min(5, self.index.ntotal))
+                for score, idx in zip(scores[0], ids[0]):
+                    if idx < 0 or score < self.threshold:
+                        break
+                    _, cached_years_back, response = self.rows[idx]
+                    if cached_years_back == years_back:
+                        return response, embedding
+        return None, embedding
+    
+    def add(self, embedding, query, years_back, response):
+        with self._lock:
+            self.index.add(embedding)
+            self.rows.append((query, years_back, response))
+
+@st.cache_resource
+def get_semantic_scholar_cache():
+    """One semantic cache (and embedding model) per server process, shared across reruns"""
+    return SemanticSerperCache() if SEMANTIC_CACHE_AVAILABLE else None
+
+@st.cache_resource
+def get_serper_session():
+    """Keep-alive session shared by every Scholar call in the server process (survives script reruns)"""
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=frozenset(["POST"]))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+def _scholar_cache_key(query, years_back):
+    return hashlib.blake2b(f"{query}|{years_back}".encode("utf-8")).hexdigest()
+
+# Publication year in Scholar snippets (common format: "- 2023 - ...")
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+def _format_scholar_results(query, years_back, data):
+    """Format a Serper.dev Scholar response"""
+    # Calculate year range
+    current_year = datetime.now().year
+    start_year = current_year - years_back
+    
+    # Check if we have results
+    if "organic" not in data or not data["organic"]:
+        return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
+    
+    # Format results
+    formatted_results = []
+    for result in data["organic"][:6]:  # Top 6 results
+        snippet = result.get("snippet", "")
+        publication_info = result.get("publicationInfo", {})
+        
+        # Extract year from snippet or publication info
+        year = ""
+        if publication_info and "year" in publication_info:
+            year = str(publication_info["year"])
+        elif snippet:
+            # Try to extract year from snippet (common format: "- 2023 - ...")
+            year_match = _YEAR_RE.search(snippet)
+            if year_match:
+                year = year_match.group(1)
+        
+        # Filter by year before doing any formatting work (results without clear year info are kept)
+        if year and (not year.isdigit() or int(year) < start_year):
+            continue
+        
+        title = result.get("title", "")
+        link = result.get("link", "")
+        authors = publication_info.get("authors", "")
+        
+        # Get citation count if available
+        citations = 0
+        if "citedBy" in result:
+            citations = result["citedBy"].get("total", 0)
+        
+        # Format result
+        parts = [f"📄 **{title}**\n"]
+        if link:
+            parts.append(f"   Link: {link}\n")
+        if authors:
+            parts.append(f"   Authors: {authors}\n")
+        if year:
+            parts.append(f"   Year: {year}\n")
+        if citations > 0:
+            parts.append(f"   Citations: {citations}\n")
+        if snippet:
+            parts.append(f"   Abstract: {snippet}\n")
+        parts.append("\n")
+        formatted_results.append("".join(parts))
+    
+    if formatted_results:
+        return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n" + "\n".join(formatted_results)
+    else:
+        return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
+
+# Serper.dev Scholar endpoint and the static part of every request payload
+SERPER_SCHOLAR_URL = "https://google.serper.dev/scholar"
+SCHOLAR_BASE_PAYLOAD = {"num": 6, "hl": "en"}  # 6 results, English
+
+@functools.lru_cache(maxsize=16)
+def _serper_headers(api_key):
+    """Request headers, built once per API key"""
+    return {'X-API-KEY': api_key, 'Content-Type': 'application/json'}
+
+@functools.lru_cache(maxsize=256)
+def _serper_scholar_fetch(api_key, query, years_back):
+    """Fetch + format Scholar results; in-process LRU first, then the on-disk cache, then Serper.dev"""
+    cache_key = _scholar_cache_key(query, years_back)
+    if _scholar_disk_cache is not None:
+        cached = _scholar_disk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
+    # Exact tiers missed: fall back to a semantically equivalent earlier query
+    semantic_cache = get_semantic_scholar_cache()
+    if semantic_cache is not None:
+        cached, embedding = semantic_cache.lookup(query, years_back)
+        if cached is not None:
+            return cached
     
-    def __init__(self, serper_api_key=None):
-        super().__init__()
-        self._serper_api_key = serper_api_key
+    # Make API request
+    payload = {**SCHOLAR_BASE_PAYLOAD, "q": query}
+    response = get_serper_session().post(SERPER_SCHOLAR_URL, headers=_serper_headers(api_key), json=payload, timeout=10)
     
-    def _run(self, query: str, years_back: int = 3) -> str:
-        """Search Google Scholar using Serper.dev API"""
+    if response.status_code != 200:
+        raise SerperAPIError(f"❌ API request failed with status {response.status_code}: {response.text}")
+    
+    formatted = _format_scholar_results(query, years_back, orjson.loads(response.content))
+    if _scholar_disk_cache is not None:
+        _scholar_disk_cache.set(cache_key, formatted, expire=SCHOLAR_CACHE_TTL)
+    if semantic_cache is not None:
+        semantic_cache.add(embedding, query, years_back, formatted)
+    return formatted
+
+class LocalizedPost(BaseModel):
+    en: str = Field(..., description="English version")
+    tr: str = Field(..., description="Turkish version")
+
+class LocalizedThread(BaseModel):
+    en: List[str] = Field(..., description="English tweets, in thread order")
+    tr: List[str] = Field(..., description="Turkish tweets, in thread order")
+
+class SocialPackage(BaseModel):
+    """All social outputs from one structured generation (parsed as JSON instead of split by markdown headers)"""
+    linkedin: LocalizedPost
+    twitter: LocalizedThread
+    midjourney: List[str] = Field(..., description="3 MidJourney prompts with parameters")
+
+def parse_social_package(task_output):
+    """SocialPackage from a task output; None when the model did not return valid JSON"""
+    if task_output.pydantic is not None:
+        return task_output.pydantic
+    raw = task_output.raw
+    try:
+        return SocialPackage.model_validate(orjson.loads(raw[raw.find("{"):raw.rfind("}") + 1]))
+    except (orjson.JSONDecodeError, ValueError):
+        return None
+
+def format_social_markdown(package):
+    """Render the package in the single-document layout used by the tabs and downloads"""
+    def thread(tweets):
+        return "\n\n".join(f"{i}/ {tweet}" for i, tweet in enumerate(tweets, 1))
+    
+    return (
+        f"# LINKEDIN POSTS\n## English\n{package.linkedin.en}\n\n## Turkish\n{package.linkedin.tr}\n\n"
+        f"# X/TWITTER POSTS\n## English\n{thread(package.twitter.en)}\n\n## Turkish\n{thread(package.twitter.tr)}\n\n"
+        "# MIDJOURNEY PROMPTS\n" + "\n\n".join(f"{i}. {prompt}" for i, prompt in enumerate(package.midjourney, 1)) + "\n"
+    )
+
+class ParallelResearchInput(BaseModel):
+    """Input schema for the parallel Scholar + web + scrape research tool."""
+    query: str = Field(..., description="Search query for Google Scholar and the web")
+    years_back: int = Field(default=3, description="Number of years back to search Google Scholar (default: 3)")
+
+# Serper.dev web search endpoint, number of top web results scraped, scraped text cap per page
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+SCRAPE_TOP_N = 3
+SCRAPE_MAX_CHARS = 4000
+SCRAPE_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; blog-poster research bot)"}
+RESEARCH_MAX_CONCURRENCY = 8  # in-flight requests per call, keeps bursts under Serper's free-tier RPM
+SCRAPE_MAX_BYTES = 2 << 20  # bodies are read up to this size; larger declared pages are skipped
+
+# Main-content extraction: trafilatura drops nav/boilerplate and runs on lxml's C parser
+# (optional: pip install trafilatura); plain lxml text, then a regex strip, are the fallbacks
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style|noscript)\b.*?</\1>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+def extract_main_text(html):
+    """Main text of an HTML page, capped at SCRAPE_MAX_CHARS to keep research prompts short"""
+    text = None
+    if trafilatura is not None:
+        text = trafilatura.extract(html, include_comments=False, favor_precision=True)
+    if not text and lxml is not None:
         try:
-            if not self._serper_api_key:
-                return "❌ SERPER_API_KEY not provided"
-            
-            # Calculate year range
-            current_year = datetime.now().year
-            start_year = current_year - years_back
-            
-            # Serper.dev API endpoint for Google Scholar
-            url = "https://google.serper.dev/scholar"
-            
-            # Headers for Serper.dev
-            headers = {
-                'X-API-KEY': self._serper_api_key,
-                'Content-Type': 'application/json'
-            }
-            
-            # Payload for Serper.dev Scholar API
-            payload = {
-                "q": query,
-                "num": 6,  # Number of results
-                "hl": "en"  # Language
-            }
-            
-            # Make API request
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
-            
-            if response.status_code != 200:
-                return f"❌ API request failed with status {response.status_code}: {response.text}"
-            
-            data = response.json()
-            
-            # Check if we have results
-            if "organic" not in data or not data["organic"]:
-                return f"🔬 No Google Scholar results found for '{query}'. Try a different search term."
+            tree = lxml.html.fromstring(html)
+            for node in tree.xpath("//script|//style|//noscript"):
+                node.drop_tree()
+            text = tree.text_content()
+        except Exception:  # lxml rejects empty or malformed documents
+            text = None
+    if not text:
+        text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", html))
+    return _WS_RE.sub(" ", text).strip()[:SCRAPE_MAX_CHARS]
+
+def scrape_rejection(status, headers):
+    """Why a fetched page should not be read and extracted (error status, not HTML, too large), or None"""
+    if status >= 400:
+        return f"HTTP {status}"
+    content_type = headers.get("content-type", "").lower()
+    if "text/html" not in content_type and "application/xhtml" not in content_type:
+        return f"not an HTML page ({content_type or 'no content-type'})"
+    content_length = headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > SCRAPE_MAX_BYTES:
+        return f"page too large ({int(content_length)} bytes)"
+    return None
+
+@functools.lru_cache(maxsize=None)
+def get_tool_classes():
+    """Define the CrewAI tools on first use (subclassing BaseTool imports the whole CrewAI stack)"""
+    from crewai.tools import BaseTool
+    from crewai_tools import ScrapeWebsiteTool
+    
+    class GoogleScholarTool(BaseTool):
+        name: str = "google_scholar_search"
+        description: str = "Search Google Scholar for academic papers and research publications using Serper.dev API."
+        args_schema: Type[BaseModel] = GoogleScholarSearchInput
+        
+        def __init__(self, serper_api_key=None):
+            # Fail at construction instead of on the agent's first tool call
+            if not serper_api_key:
+                raise ValueError("SERPER_API_KEY required")
+            super().__init__()
+            self._serper_api_key = serper_api_key
+        
+        def _run(self, query: str, years_back: int = 3) -> str:
+            """Search Google Scholar using Serper.dev API"""
+            try:
+                # Repeated (query, years_back) pairs are served from cache instead of Serper.dev
+                return _serper_scholar_fetch(self._serper_api_key, query, years_back)
+                    
+            except SerperAPIError as e:
+                return str(e)
+            except requests.exceptions.Timeout:
+                return "❌ Google Scholar search timed out. Try again."
+            except requests.exceptions.RequestException as e:
+                return f"❌ Network error during Google Scholar search: {str(e)}"
+            except Exception as e:
+                return f"❌ Google Scholar search failed: {str(e)}"
+    
+    class ParallelResearchTool(BaseTool):
+        name: str = "parallel_research"
+        description: str = (
+            "Research a query in one call: searches Google Scholar and the web at the same time "
+            "and returns the text of the top web pages. Faster than calling separate tools one after another."
+        )
+        args_schema: Type[BaseModel] = ParallelResearchInput
+        
+        def __init__(self, scholar_tool, serper_api_key=None):
+            if not serper_api_key:
+                raise ValueError("SERPER_API_KEY required")
+            super().__init__()
+            self._scholar_tool = scholar_tool
+            self._serper_api_key = serper_api_key
+        
+        @retry(stop=stop_after_attempt(4), wait=wait_retry_after, retry=retry_if_exception_type(TransientAPIError), reraise=True)
+        async def _web_search_request(self, session, semaphore, query):
+            """One Serper.dev web search; 429/5xx raise TransientAPIError so they are retried with backoff"""
+            payload = {"q": query, "num": 6}
+            async with semaphore:
+                async with session.post(SERPER_SEARCH_URL, headers=_serper_headers(self._serper_api_key), json=payload) as response:
+                    if response.status in TRANSIENT_STATUS:
+                        raise TransientAPIError(f"status {response.status}", response.headers.get("Retry-After"))
+                    if response.status != 200:
+                        raise SerperAPIError(f"status {response.status}")
+                    return orjson.loads(await response.read())
+        
+        async def _web_search(self, session, semaphore, query):
+            """Serper.dev web results as (formatted text, top URLs)"""
+            try:
+                data = await self._web_search_request(session, semaphore, query)
+            except (TransientAPIError, SerperAPIError) as e:
+                return f"❌ Web search failed with {str(e)}", []
             
-            # Format results
-            formatted_results = []
-            for result in data["organic"][:6]:  # Top 6 results
-                title = result.get("title", "")
-                link = result.get("link", "")
-                snippet = result.get("snippet", "")
-                
-                # Extract publication info if available
-                publication_info = result.get("publicationInfo", {})
-                authors = publication_info.get("authors", "")
-                
-                # Extract year from snippet or publication info
-                year = ""
-                if publication_info and "year" in publication_info:
-                    year = str(publication_info["year"])
-                elif snippet:
-                    # Try to extract year from snippet (common format: "- 2023 - ...")
-                    year_match = re.search(r'\b(20\d{2})\b', snippet)
-                    if year_match:
-                        year = year_match.group(1)
-                
-                # Get citation count if available
-                citations = 0
-                if "citedBy" in result:
-                    citations = result["citedBy"].get("total", 0)
-                
-                # Format result
-                result_text = f"📄 **{title}**\n"
-                if link:
-                    result_text += f"   Link: {link}\n"
-                if authors:
-                    result_text += f"   Authors: {authors}\n"
-                if year:
-                    result_text += f"   Year: {year}\n"
-                if citations > 0:
-                    result_text += f"   Citations: {citations}\n"
-                if snippet:
-                    result_text += f"   Abstract: {snippet}\n"
-                result_text += "\n"
-                
-                # Filter by year if specified and we found a year
-                if year and year.isdigit() and int(year) >= start_year:
-                    formatted_results.append(result_text)
-                elif not year:  # Include results without clear year info
-                    formatted_results.append(result_text)
+            organic = data.get("organic", [])
+            lines = [f"- **{r.get('title', 'No title')}** ({r.get('link', '')})\n  {r.get('snippet', '')}" for r in organic]
+            return "\n".join(lines) or "No web results found.", [r["link"] for r in organic if r.get("link")]
+        
+        async def _scrape(self, session, semaphore, url):
+            try:
+                async with semaphore:
+                    async with session.get(url, headers=SCRAPE_HEADERS) as response:
+                        rejection = scrape_rejection(response.status, response.headers)
+                        if rejection:
+                            return f"❌ Could not scrape {url}: {rejection}"
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(65536):
+                            body += chunk
+                            if len(body) >= SCRAPE_MAX_BYTES:
+                                break
+                        html = body[:SCRAPE_MAX_BYTES].decode(response.charset or "utf-8", errors="replace")
+                return f"📄 **{url}**\n{extract_main_text(html)}"
+            except (aiohttp.ClientError, asyncio.TimeoutError, LookupError) as e:  # LookupError: unknown charset
+                return f"❌ Could not scrape {url}: {str(e)}"
+        
+        async def _search_and_scrape(self, session, semaphore, query):
+            """Web search, then the top result pages fetched concurrently"""
+            web_text, urls = await self._web_search(session, semaphore, query)
+            pages = await asyncio.gather(*(self._scrape(session, semaphore, url) for url in urls[:SCRAPE_TOP_N]))
+            return web_text, pages
+        
+        async def _arun(self, query, years_back):
+            semaphore = asyncio.Semaphore(RESEARCH_MAX_CONCURRENCY)
+            connector = aiohttp.TCPConnector(limit=32)
+            async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=15)) as session:
+                # Scholar (pooled requests session + caches) runs in a thread alongside the web branch
+                scholar_text, (web_text, pages) = await asyncio.gather(
+                    asyncio.to_thread(self._scholar_tool._run, query, years_back),
+                    self._search_and_scrape(session, semaphore, query),
+                )
             
-            if formatted_results:
-                return f"🔬 **Google Scholar Results for '{query}' (via Serper.dev):**\n\n" + "\n".join(formatted_results)
-            else:
-                return f"🔬 No recent Google Scholar results found for '{query}' from the last {years_back} years."
-                
-        except requests.exceptions.Timeout:
-            return "❌ Google Scholar search timed out. Try again."
-        except requests.exceptions.RequestException as e:
-            return f"❌ Network error during Google Scholar search: {str(e)}"
-        except Exception as e:
-            return f"❌ Google Scholar search failed: {str(e)}"
+            parts = [scholar_text, f"🌐 **Web Results for '{query}':**\n\n{web_text}"]
+            if pages:
+                parts.append("📑 **Top Pages:**\n\n" + "\n\n".join(pages))
+            return "\n\n---\n\n".join(parts)
+        
+        def _run(self, query: str, years_back: int = 3) -> str:
+            """Wall-clock is max(scholar, web search + slowest page) instead of the sum of every call"""
+            try:
+                return asyncio.run(self._arun(query, years_back))
+            except Exception as e:
+                return f"❌ Parallel research failed: {str(e)}"
+    
+    class FastScrapeTool(ScrapeWebsiteTool):
+        """ScrapeWebsiteTool with httpx fetching and trafilatura/lxml extraction instead of BeautifulSoup"""
+        
+        def _run(self, **kwargs) -> str:
+            website_url = kwargs.get("website_url") or self.website_url
+            if not isinstance(website_url, str) or urlsplit(website_url).scheme not in ("http", "https") or not urlsplit(website_url).netloc:
+                return f"❌ Could not scrape {website_url!r}: an absolute http(s) URL is required"
+            try:
+                with httpx.stream("GET", website_url, timeout=5, follow_redirects=True, headers=SCRAPE_HEADERS) as response:
+                    rejection = scrape_rejection(response.status_code, response.headers)
+                    if rejection:
+                        return f"❌ Could not scrape {website_url}: {rejection}"
+                    body = bytearray()
+                    for chunk in response.iter_bytes(65536):
+                        body += chunk
+                        if len(body) >= SCRAPE_MAX_BYTES:
+                            break
+                    html = body[:SCRAPE_MAX_BYTES].decode(response.encoding or "utf-8", errors="replace")
+            except (httpx.HTTPError, httpx.InvalidURL, TypeError, ValueError, LookupError) as e:
+                return f"❌ Could not scrape {website_url}: {str(e)}"
+            return extract_main_text(html)
+    
+    return GoogleScholarTool, ParallelResearchTool, FastScrapeTool
 
 # ======================
 # Streamlit Multi-Agent Content Creator
 # ======================
+# Timeouts are enforced inside the worker thread (litellm per request, CrewAI max_execution_time
+# per agent, retries stop after AGENT_TIMEOUT) so a timed-out agent stops spending Groq tokens
+LLM_REQUEST_TIMEOUT = 60
+AGENT_TIMEOUT = 300
+# How many agent crews may call Groq at once
+AGENT_CONCURRENCY = 3
+
+# Streamed token chunks are routed to the queue of the run that owns the LLM (keyed by id(llm))
+_STREAM_QUEUES = {}
+
+@functools.lru_cache(maxsize=None)
+def register_stream_listener():
+    """Hook CrewAI's LLM stream-chunk event once per process; False if this CrewAI has no such event"""
+    try:
+        from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+    except ImportError:
+        try:
+            from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+        except ImportError:
+            return False
+    
+    @crewai_event_bus.on(LLMStreamChunkEvent)
+    def _on_chunk(source, event):
+        stream_queue = _STREAM_QUEUES.get(id(source))
+        if stream_queue is not None:
+            stream_queue.put(("chunk", event.chunk))
+    
+    return True
+
+# Filename and prompt hygiene, compiled once (re.sub runs in C)
+_SAFE_CHAR_RE = re.compile(r"[^A-Za-z0-9 _-]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Research reports cached on disk per (normalized topic, research model, prompt version);
+# bump RESEARCH_PROMPT_VERSION whenever create_research_task's prompt changes
+RESEARCH_PROMPT_VERSION = 4
+RESEARCH_CACHE_TTL = 24 * 3600
+_research_disk_cache = diskcache.Cache("./.cache/research") if diskcache else None
+
+def research_cache_key(topic, model_id):
+    topic_norm = _WHITESPACE_RE.sub(" ", topic.strip().lower())
+    return hashlib.sha1(f"{topic_norm}\0{model_id}\0{RESEARCH_PROMPT_VERSION}".encode("utf-8")).hexdigest()
+
+# Agent system prompts: module constants with no {topic} placeholder, so each agent's
+# system prompt is byte-identical across runs and topics and Groq's prefix cache can hit
+RESEARCHER_BACKSTORY = """You are a meticulous research analyst with expertise in finding and synthesizing information from multiple sources. You excel at:
+
+- Finding relevant academic papers and research studies
+- Gathering current industry data and statistics
+- Identifying credible sources and fact-checking information
+- Extracting key insights from complex documents
+- Organizing research findings in a structured manner
+- Distinguishing between reliable and unreliable sources
+
+You use Google Scholar for academic research, web search for current trends, and content scraping for detailed information extraction. Your research forms the foundation for all content creation."""
+
+WRITER_BACKSTORY = """You are an experienced technical writer with 10+ years in data science and technology. You specialize in:
+
+- Transforming complex research into accessible technical content
+- Writing comprehensive blog posts (1000-1500 words)
+- Including code examples and practical implementations
+- Explaining technical concepts with real-world analogies
+- Creating engaging introductions and compelling conclusions
+- Structuring content for maximum readability and impact
+- Balancing technical depth with accessibility
+
+You take research findings and craft them into compelling, informative blog posts that provide genuine value to technical professionals. You write from personal experience and include practical insights."""
+
+SOCIAL_BACKSTORY = """You are a social media expert who specializes in technical content for professional audiences. You excel at:
+
+- Adapting technical content for social media platforms
+- Creating engaging LinkedIn posts for professional networks
+- Crafting Twitter threads that capture attention
+- Translating content culturally for Turkish audiences
+- Generating detailed prompts for AI image generation
+- Using appropriate hashtags and calls-to-action
+- Maintaining brand voice across different platforms
+
+You take comprehensive blog content and transform it into bite-sized, shareable content that drives engagement while maintaining technical accuracy. You understand the nuances of different social platforms and cultural adaptation."""
+
+# Task prompts: terse on purpose, since input tokens drive time-to-first-token on every agent call
+RESEARCH_TMPL = """Research '{topic}'.
+Use Google Scholar for papers from the last 3 years, web search for industry trends and statistics, and scraping for technical details.
+Output a structured report: academic findings with citations, industry trends and statistics, technical implementations and code examples, key insights, sources."""
+
+CONTENT_TMPL = """Write a 1000-1500 word technical blog post about '{topic}' from the research findings.
+Structure: title, introduction, 3-4 sections with subheadings, code snippets where relevant, real-world applications, challenges and solutions, conclusion with key takeaways.
+Style: first-person practitioner voice, technical but accessible, named tools and libraries, statistics and sources from the research, no marketing language.
+Format: markdown with headings and code blocks."""
+
+SOCIAL_TMPL = """Create social media content and image prompts for '{topic}' from the research findings.
+LinkedIn: English post (250-300 words) for data/tech professionals and a culturally adapted Turkish version, with key insights, hashtags and a call to action.
+X/Twitter: English 3-4 tweet thread and a Turkish adaptation, each tweet under 280 characters.
+MidJourney: 3 prompts for technical blog visuals with --ar 16:9 (blog header) or --ar 1:1 (social) and --v 6.
+Return one JSON object and nothing else:
+{{"linkedin": {{"en": "...", "tr": "..."}}, "twitter": {{"en": ["tweet", ...], "tr": ["tweet", ...]}}, "midjourney": ["prompt", "prompt", "prompt"]}}"""
+
+RESEARCH_BRIEF_PROMPT = """Condense this research report into a brief for a blog writer, at most 400 tokens plus the References block.
+Keep every statistic, paper citation, tool name, code-relevant detail and [citation n] marker, and copy the References block as is; drop repetition and filler."""
+
+# Research handed to the brief/writer is capped at this many tokens after deduplication
+RESEARCH_TOKEN_BUDGET = 2000
+PARAGRAPH_DUP_THRESHOLD = 0.9
+_URL_RE = re.compile(r"https?://[^\s)\]>\"']+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+@functools.lru_cache(maxsize=1)
+def _token_encoder():
+    """gpt-4o tokenizer as a local token counter (tiktoken ships with litellm); None falls back to ~4 chars/token"""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception:
+        return None
+
+def count_tokens(text):
+    encoder = _token_encoder()
+    return len(encoder.encode(text)) if encoder else len(text) // 4
+
+@st.cache_resource
+def get_paragraph_encoder():
+    """Sentence embedder for research dedupe: the semantic Scholar cache's model if loaded, else MiniLM on CPU, else None"""
+    semantic_cache = get_semantic_scholar_cache()
+    if semantic_cache is not None:
+        return semantic_cache.model
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    return SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
+
+def compact_research(report, encoder=None, budget=RESEARCH_TOKEN_BUDGET):
+    """Swap URLs for [citation n] markers plus a references block; over budget, drop near-duplicate paragraphs and keep the rest in order up to budget"""
+    citations = {}
+    
+    def cite(match):
+        url = match.group(0).rstrip(".,;:")
+        number = citations.setdefault(url, len(citations) + 1)
+        return f"[citation {number}]" + match.group(0)[len(url):]
+    
+    text = _URL_RE.sub(cite, report)
+    if count_tokens(text) > budget:
+        paragraphs = [p.strip() for p in _PARAGRAPH_SPLIT_RE.split(text) if p.strip()]
+        if encoder is not None:
+            embeddings = encoder.encode(paragraphs, normalize_embeddings=True, convert_to_numpy=True)
+            
+            def is_duplicate(i, kept):
+                return any(float(embeddings[i] @ embeddings[j]) >= PARAGRAPH_DUP_THRESHOLD for j in kept)
+        else:
+            normalized = [_WHITESPACE_RE.sub(" ", p).lower() for p in paragraphs]
+            
+            def is_duplicate(i, kept):
+                return any(normalized[i] == normalized[j] for j in kept)
+        
+        kept, used = [], 0
+        for i, paragraph in enumerate(paragraphs):
+            tokens = count_tokens(paragraph)
+            if used + tokens > budget or is_duplicate(i, kept):
+                continue  # a shorter later paragraph may still fit
+            kept.append(i)
+            used += tokens
+        text = "\n\n".join(paragraphs[i] for i in kept)
+    
+    if citations:
+        text += "\n\nReferences:\n" + "\n".join(f"[citation {n}] {url}" for url, n in citations.items())
+    return text
+
+@st.cache_resource
+def get_llm_http_client():
+    """One pooled HTTP/2 client for every litellm call in the process, so agents share keep-alive connections to Groq"""
+    import litellm
+    
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=httpx.Timeout(60.0, connect=5.0),  # fail fast on connect, leave room for long generations
+    )
+    litellm.client_session = client
+    return client
+
+# Bulk mode: topics processed at once (each already runs up to AGENT_CONCURRENCY agent crews)
+# and where finished topics are checkpointed
+BULK_WORKERS = 2
+BULK_CHECKPOINT_DIR = pathlib.Path("./.cache/bulk")
+BULK_CHECKPOINT_TTL = 7 * 24 * 3600
+
+# Groq model per speed tier
+SPEED_MAP = {
+    "instant": "groq/llama-3.1-8b-instant",
+    "balanced": "groq/llama-3.3-70b-versatile",
+    "quality": "groq/deepseek-r1-distill-llama-70b",
+}
+
 class StreamlitMultiAgentContentCreator:
     """Streamlit version of multi-agent content creator"""
     
     def __init__(self, groq_api_key, serper_api_key):
-        # LLM Configurations
+        from crewai import LLM
+        GoogleScholarTool, ParallelResearchTool, FastScrapeTool = get_tool_classes()
+        get_llm_http_client()
+        self.groq_breaker = get_groq_breaker()  # resolved here: crews run in worker threads
+        self._api_keys = (groq_api_key, serper_api_key)  # bulk mode builds one creator per worker
+        self.paragraph_encoder = get_paragraph_encoder()
+        
+        # LLM Configurations, routed by tier: research is query reformulation and
+        # summarization, so it runs on the instant tier; only the blog post needs a 70B writer
         self.research_llm = LLM(
-            model="groq/qwen/qwen3-32b",
+            model=SPEED_MAP["instant"],
+            api_key=groq_api_key,
+            temperature=0,  # deterministic, so repeat prompts are cache-friendly
+            max_tokens=800,
+            timeout=LLM_REQUEST_TIMEOUT
+        )
+        
+        # Condenses the research report into the writer's brief (~60% fewer writer input tokens)
+        self.brief_llm = LLM(
+            model=SPEED_MAP["instant"],
             api_key=groq_api_key,
-            temperature=0.3,
-            max_tokens=3000
+            temperature=0,
+            max_tokens=600,  # 400-token brief + references block
+            timeout=LLM_REQUEST_TIMEOUT
         )
         
+        # The blog writer streams, so the post can be shown while it is being written
         self.content_llm = LLM(
-            model="groq/deepseek-r1-distill-llama-70b",
+            model=SPEED_MAP["balanced"],  # 70B quality, no <think> traces
             api_key=groq_api_key,
             temperature=0.6,
-            max_tokens=4000
+            max_tokens=2500,  # a 1000-1500 word post is ~2000 tokens
+            timeout=LLM_REQUEST_TIMEOUT,
+            stream=register_stream_listener()
         )
         
         self.social_llm = LLM(
-            model="groq/deepseek-r1-distill-llama-70b",
+            model=SPEED_MAP["balanced"],
             api_key=groq_api_key,
             temperature=0.7,
-            max_tokens=2000
+            max_tokens=2000,
+            timeout=LLM_REQUEST_TIMEOUT
         )
         
         # Initialize tools
         self.scholar_tool = GoogleScholarTool(serper_api_key)
-        self.serper_tool = SerperDevTool(api_key=serper_api_key)
-        self.scraper_tool = ScrapeWebsiteTool()
+        self.scraper_tool = FastScrapeTool()
+        self.parallel_research_tool = ParallelResearchTool(self.scholar_tool, serper_api_key)
         
         # Initialize agents
         self._create_agents()
     
     def _create_agents(self):
         """Create the three specialized agents"""
+        from crewai import Agent
         
         # Research Agent
         self.researcher = Agent(
             role="Senior Research Analyst",
-            goal="Conduct comprehensive research on '{topic}' using academic sources, web search, and content scraping to gather factual, up-to-date information.",
-            backstory="""You are a meticulous research analyst with expertise in finding and synthesizing 
-            information from multiple sources. You excel at:
-            
-            - Finding relevant academic papers and research studies
-            - Gathering current industry data and statistics
-            - Identifying credible sources and fact-checking information
-            - Extracting key insights from complex documents
-            - Organizing research findings in a structured manner
-            - Distinguishing between reliable and unreliable sources
-            
-            You use Google Scholar for academic research, web search for current trends, 
-            and content scraping for detailed information extraction. Your research forms 
-            the foundation for all content creation.""",
-            tools=[self.scholar_tool, self.serper_tool, self.scraper_tool],
+            goal="Conduct comprehensive research using academic sources, web search, and content scraping to gather factual, up-to-date information.",
+            backstory=RESEARCHER_BACKSTORY,
+            tools=[self.parallel_research_tool, self.scraper_tool],  # scraper kept for follow-up deep dives
             llm=self.research_llm,
             verbose=True,
             max_iter=4,
+            max_execution_time=AGENT_TIMEOUT,
             max_rpm=6,
             allow_delegation=False
         )
@@ -204,25 +765,13 @@ class StreamlitMultiAgentContentCreator:
         # Content Writer Agent
         self.content_writer = Agent(
             role="Senior Technical Content Writer",
-            goal="Create comprehensive, engaging technical blog posts about '{topic}' based on research findings, with a focus on practical implementation and real-world applications.",
-            backstory="""You are an experienced technical writer with 10+ years in data science 
-            and technology. You specialize in:
-            
-            - Transforming complex research into accessible technical content
-            - Writing comprehensive blog posts (1000-1500 words)
-            - Including code examples and practical implementations
-            - Explaining technical concepts with real-world analogies
-            - Creating engaging introductions and compelling conclusions
-            - Structuring content for maximum readability and impact
-            - Balancing technical depth with accessibility
-            
-            You take research findings and craft them into compelling, informative 
-            blog posts that provide genuine value to technical professionals. You write 
-            from personal experience and include practical insights.""",
+            goal="Create comprehensive, engaging technical blog posts based on research findings, with a focus on practical implementation and real-world applications.",
+            backstory=WRITER_BACKSTORY,
             tools=[],
             llm=self.content_llm,
             verbose=True,
             max_iter=3,
+            max_execution_time=AGENT_TIMEOUT,
             max_rpm=4,
             allow_delegation=False
         )
@@ -230,230 +779,299 @@ class StreamlitMultiAgentContentCreator:
         # Social Media Specialist
         self.social_media_specialist = Agent(
             role="Social Media Content Specialist",
-            goal="Create engaging social media content for LinkedIn and Twitter in both English and Turkish, plus generate detailed MidJourney prompts for visual content about '{topic}'.",
-            backstory="""You are a social media expert who specializes in technical content 
-            for professional audiences. You excel at:
-            
-            - Adapting technical content for social media platforms
-            - Creating engaging LinkedIn posts for professional networks
-            - Crafting Twitter threads that capture attention
-            - Translating content culturally for Turkish audiences
-            - Generating detailed prompts for AI image generation
-            - Using appropriate hashtags and calls-to-action
-            - Maintaining brand voice across different platforms
-            
-            You take comprehensive blog content and transform it into bite-sized, 
-            shareable content that drives engagement while maintaining technical accuracy. 
-            You understand the nuances of different social platforms and cultural adaptation.""",
+            goal="Create engaging social media content for LinkedIn and Twitter in both English and Turkish, plus generate detailed MidJourney prompts for visual content.",
+            backstory=SOCIAL_BACKSTORY,
             tools=[],
             llm=self.social_llm,
             verbose=True,
             max_iter=2,
+            max_execution_time=AGENT_TIMEOUT,
             max_rpm=4,
             allow_delegation=False
         )
 
     def create_research_task(self, topic):
         """Task for the research agent"""
+        from crewai import Task
+        
         return Task(
-            description=f"""
-            Conduct comprehensive research on the topic: '{topic}'
-            
-            🔬 RESEARCH OBJECTIVES:
-            
-            1. ACADEMIC RESEARCH:
-            - Use Google Scholar to find recent academic papers (last 3 years)
-            - Look for research studies, whitepapers, and scientific publications
-            - Focus on peer-reviewed sources and credible academic institutions
-            - Extract key findings, methodologies, and conclusions
-            
-            2. INDUSTRY RESEARCH:
-            - Use web search to find current industry trends and applications
-            - Look for case studies, implementation examples, and best practices
-            - Find statistics, market data, and recent developments
-            - Identify leading companies and their approaches
-            
-            3. TECHNICAL RESEARCH:
-            - Search for technical implementations, code repositories, and tutorials
-            - Find practical examples and real-world applications
-            - Look for tools, frameworks, and methodologies
-            - Identify common challenges and solutions
-            
-            4. CONTENT SCRAPING:
-            - Extract detailed information from relevant websites and articles
-            - Gather specific examples, quotes, and technical details
-            - Find supporting data and evidence
-            
-            DELIVERABLE FORMAT:
-            Provide a comprehensive research report with:
-            - Academic findings with citations
-            - Industry trends and statistics
-            - Technical implementations and examples
-            - Key insights and takeaways
-            - Credible sources and references
-            
-            Focus on factual, up-to-date information that will serve as the foundation 
-            for creating high-quality technical content.
-            """,
-            expected_output="Comprehensive research report with academic sources, industry data, technical examples, and key insights about the topic",
+            description=RESEARCH_TMPL.format(topic=topic),
+            expected_output="Structured research report with cited academic findings, statistics, technical examples and sources",
             agent=self.researcher
         )
 
-    def create_content_writing_task(self, topic):
+    def create_content_writing_task(self, topic, research_task):
         """Task for the content writer agent"""
+        from crewai import Task
+        
         return Task(
-            description=f"""
-            Create a comprehensive technical blog post about '{topic}' based on the research findings.
-            
-            📝 CONTENT CREATION OBJECTIVES:
-            
-            1. BLOG POST STRUCTURE (1000-1500 words):
-            - Compelling title and introduction
-            - 3-4 main sections with clear subheadings
-            - Technical depth with practical examples
-            - Code snippets or pseudocode where relevant
-            - Real-world applications and use cases
-            - Challenges and solutions
-            - Conclusion with key takeaways
-            
-            2. WRITING STYLE:
-            - Technical but accessible to professionals
-            - First-person perspective with personal insights
-            - Include mathematical concepts or statistical methods if applicable
-            - Reference specific tools, libraries, or frameworks
-            - Share lessons learned and practical tips
-            - Avoid marketing language - focus on substance
-            
-            3. CONTENT REQUIREMENTS:
-            - Use research findings as the foundation
-            - Include current statistics and data
-            - Reference academic sources and industry examples
-            - Provide actionable insights
-            - Ensure technical accuracy
-            - Make it engaging and valuable for readers
-            
-            4. FORMAT:
-            - Use proper markdown formatting
-            - Include clear headings and subheadings
-            - Add code blocks where appropriate
-            - Structure for easy reading and scanning
-            
-            Write as a practicing data scientist/technologist sharing genuine insights 
-            and practical knowledge with fellow professionals.
-            """,
-            expected_output="Comprehensive technical blog post (1000-1500 words) with practical insights, code examples, and real-world applications",
-            agent=self.content_writer
+            description=CONTENT_TMPL.format(topic=topic),
+            expected_output="1000-1500 word markdown technical blog post",
+            agent=self.content_writer,
+            context=[research_task]
         )
 
-    def create_social_media_task(self, topic):
-        """Task for the social media specialist"""
+    def create_social_media_task(self, topic, research_task):
+        """Draft social package from the research alone, so it can run alongside the blog post"""
+        from crewai import Task
+        
         return Task(
-            description=f"""
-            Create engaging social media content and visual prompts for '{topic}' based on the blog post content.
-            
-            📱 SOCIAL MEDIA OBJECTIVES:
-            
-            1. LINKEDIN POSTS:
-            - English: Professional post (250-300 words) for data science/tech professionals
-            - Turkish: Culturally adapted version for Turkish business audience
-            - Include key insights from the blog post
-            - Add relevant hashtags (#DataScience #MachineLearning #AI #Technology)
-            - Include call-to-action for engagement
-            
-            2. X/TWITTER POSTS:
-            - English: Create 3-4 tweet thread with key insights and technical highlights
-            - Turkish: Adapt the thread for Turkish tech community
-            - Keep each tweet under 280 characters
-            - Include code snippets or technical examples where possible
-            - Use relevant hashtags and mentions
-            
-            3. MIDJOURNEY PROMPTS:
-            - Create 3 detailed MidJourney prompts for technical blog visuals
-            - Include technical elements (code, diagrams, data flows, AI concepts)
-            - Specify aspect ratios (--ar 16:9 for blog headers, --ar 1:1 for social media)
-            - Use professional tech aesthetics (dark themes, neon accents, clean minimal)
-            - Include version and style parameters (--v 6 --style modern tech)
-            
-            4. CONTENT ADAPTATION:
-            - Extract key points from the blog post
-            - Adapt technical content for social media consumption
-            - Maintain accuracy while making it engaging
-            - Consider platform-specific best practices
-            - Ensure cultural sensitivity for Turkish content
-            
-            Format your response:
-            # LINKEDIN POSTS
-            ## English
-            [LinkedIn content]
-            ## Turkish  
-            [Turkish LinkedIn content]
-            
-            # X/TWITTER POSTS
-            ## English
-            [Twitter thread]
-            ## Turkish
-            [Turkish Twitter thread]
-            
-            # MIDJOURNEY PROMPTS
-            [3 detailed MidJourney prompts with parameters]
-            """,
-            expected_output="Complete social media package with LinkedIn posts, Twitter threads (English & Turkish), and MidJourney prompts for visual content",
-            agent=self.social_media_specialist
+            description=SOCIAL_TMPL.format(topic=topic),
+            expected_output="JSON object with LinkedIn posts, X/Twitter threads (English & Turkish) and 3 MidJourney prompts",
+            output_pydantic=SocialPackage,
+            agent=self.social_media_specialist,
+            context=[research_task]
         )
 
-    def create_content(self, topic, progress_callback=None):
-        """Main function to create content using multi-agent system"""
+    async def _run_task(self, agent, task, topic, semaphore):
+        """Run one task as its own single-agent crew; the semaphore bounds concurrent LLM calls"""
+        from crewai import Crew, Process
+        
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=True,
+            max_rpm=3
+        )
+        async with semaphore:
+            results = await asyncio.to_thread(self._kickoff_with_retry, crew, topic)
+        return results.tasks_output[0]
+
+    @retry(stop=stop_after_attempt(4) | stop_after_delay(AGENT_TIMEOUT), wait=wait_retry_after, retry=retry_if_exception(is_transient_llm_error), reraise=True)
+    def _kickoff_with_retry(self, crew, topic):
+        """Kick off a crew, retrying Groq rate limits/outages; an open circuit breaker fails immediately"""
+        if self.groq_breaker is None:
+            return crew.kickoff(inputs={"topic": topic})
+        return self.groq_breaker.call(crew.kickoff, inputs={"topic": topic})
+
+    async def _research_brief_task(self, topic, research_task, semaphore):
+        """Stand-in task whose output is a condensed brief of the research; the compacted report if condensing fails"""
+        from crewai import Task
+        from crewai.tasks.task_output import TaskOutput
+        
+        research = await asyncio.to_thread(compact_research, research_task.output.raw, self.paragraph_encoder)
+        messages = [
+            {"role": "system", "content": RESEARCH_BRIEF_PROMPT},
+            {"role": "user", "content": research},
+        ]
+        try:
+            async with semaphore:
+                brief = await asyncio.to_thread(self.brief_llm.call, messages)
+        except Exception:
+            brief = research
+        
+        brief_task = Task(description=f"Research brief for '{topic}'", expected_output="Condensed research brief", agent=self.researcher)
+        brief_task.output = TaskOutput(description=brief_task.description, raw=brief, agent=self.researcher.role)
+        return brief_task
+
+    async def create_content_async(self, topic, progress_callback=None, stream_queue=None):
+        """Research, then the brief + blog post alongside the social package (one social call per topic)"""
+        if stream_queue is not None:
+            _STREAM_QUEUES[id(self.content_llm)] = stream_queue
+        
         try:
             if progress_callback:
                 progress_callback("Creating tasks for agents...")
             
-            # Create tasks for each agent
+            # Create tasks for each agent; context links carry outputs across the separate crews
             research_task = self.create_research_task(topic)
-            content_task = self.create_content_writing_task(topic)
-            social_task = self.create_social_media_task(topic)
+            social_task = self.create_social_media_task(topic, research_task)
+            semaphore = asyncio.Semaphore(AGENT_CONCURRENCY)
             
             if progress_callback:
-                progress_callback("Initializing multi-agent crew...")
+                progress_callback("Starting content creation process...")
             
-            # Create multi-agent crew with sequential process
-            crew = Crew(
-                agents=[self.researcher, self.content_writer, self.social_media_specialist],
-                tasks=[research_task, content_task, social_task],
-                process=Process.sequential,
-                verbose=True,
-                max_rpm=3
-            )
+            # Wall-clock seconds per phase, returned with the result so runs can be compared
+            timings = {}
+            started = time.perf_counter()
+            
+            # Repeat topics skip the research phase; the research LLM runs at temperature 0
+            research_key = research_cache_key(topic, self.research_llm.model)
+            cached_research = _research_disk_cache.get(research_key) if _research_disk_cache is not None else None
+            if cached_research is not None:
+                from crewai.tasks.task_output import TaskOutput
+                
+                if progress_callback:
+                    progress_callback("⚡ Reusing cached research for this topic...")
+                research_result = TaskOutput(description=research_task.description, raw=cached_research, agent=self.researcher.role)
+                research_task.output = research_result  # downstream task context reads it from here
+            else:
+                research_result = await self._run_task(self.researcher, research_task, topic, semaphore)
+                if _research_disk_cache is not None:
+                    _research_disk_cache.set(research_key, research_result.raw, expire=RESEARCH_CACHE_TTL)
+            timings["research"] = time.perf_counter() - started
             
             if progress_callback:
-                progress_callback("Starting content creation process...")
+                progress_callback("✍️ Writing the blog post and drafting social content in parallel...")
+            
+            async def write_blog():
+                # Pipelined: condense the research, then write from the brief instead of the full dump
+                phase_start = time.perf_counter()
+                brief_task = await self._research_brief_task(topic, research_task, semaphore)
+                timings["brief"] = time.perf_counter() - phase_start
+                content_task = self.create_content_writing_task(topic, brief_task)
+                content_result = await self._run_task(self.content_writer, content_task, topic, semaphore)
+                timings["blog"] = time.perf_counter() - phase_start - timings["brief"]
+                return content_result
             
-            # Execute the multi-agent workflow
-            results = crew.kickoff(inputs={"topic": topic})
+            async def write_social():
+                phase_start = time.perf_counter()
+                social_result = await self._run_task(self.social_media_specialist, social_task, topic, semaphore)
+                timings["social"] = time.perf_counter() - phase_start
+                return social_result
+            
+            # The social package only needs the research, so it overlaps with the brief and the blog post
+            content_result, social_result = await asyncio.gather(write_blog(), write_social())
+            timings["total"] = time.perf_counter() - started
             
             if progress_callback:
                 progress_callback("Content creation completed! Preparing results...")
             
-            # Extract individual results
-            research_result = results.tasks_output[0] if hasattr(results, 'tasks_output') else "Research completed"
-            content_result = results.tasks_output[1] if hasattr(results, 'tasks_output') else "Content completed"
-            social_result = results.tasks_output[2] if hasattr(results, 'tasks_output') else "Social media completed"
+            # Structured output renders to markdown client-side; unparseable output is shown as-is
+            social_package = parse_social_package(social_result)
             
             return {
                 "research": research_result,
                 "content": content_result,
-                "social": social_result,
+                "social": format_social_markdown(social_package) if social_package else social_result,
+                "social_json": social_package.model_dump() if social_package else None,
+                "timings": timings,
                 "success": True
             }
             
+        except (asyncio.TimeoutError, TimeoutError):
+            return {
+                "error": f"An agent did not finish within {AGENT_TIMEOUT} seconds",
+                "success": False
+            }
         except Exception as e:
             return {
                 "error": str(e),
                 "success": False
             }
+        finally:
+            _STREAM_QUEUES.pop(id(self.content_llm), None)
+
+    def create_content(self, topic, progress_callback=None, stream_queue=None):
+        """Main function to create content using multi-agent system"""
+        return asyncio.run(self.create_content_async(topic, progress_callback, stream_queue))
+
+    async def create_content_batch_async(self, topics, progress_callback=None):
+        """Run many topics on BULK_WORKERS creators; finished topics are checkpointed to disk so a rerun resumes"""
+        BULK_CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        pending = list(dict.fromkeys(topics))  # drop duplicate topics, keep order
+        total = len(pending)
+        results = {}
+        
+        async def worker(creator):
+            # Each worker owns its creator: CrewAI agents are not safe to run in two crews at once
+            while pending:
+                topic = pending.pop(0)
+                checkpoint = BULK_CHECKPOINT_DIR / f"{creator.bulk_checkpoint_key(topic)}.json"
+                if checkpoint.is_file() and time.time() - checkpoint.stat().st_mtime < BULK_CHECKPOINT_TTL:
+                    result = orjson.loads(checkpoint.read_bytes())
+                else:
+                    result = serializable_result(await creator.create_content_async(topic))
+                    if result["success"]:
+                        checkpoint.write_bytes(orjson.dumps(result))
+                results[topic] = result
+                if progress_callback:
+                    progress_callback(len(results), total, topic)
+        
+        workers = [self] + [StreamlitMultiAgentContentCreator(*self._api_keys) for _ in range(min(BULK_WORKERS, total) - 1)]
+        await asyncio.gather(*(worker(creator) for creator in workers))
+        return {topic: results[topic] for topic in dict.fromkeys(topics)}
+
+    def bulk_checkpoint_key(self, topic):
+        """Checkpoint key per topic, models and prompts, so changing any of them regenerates the package"""
+        prompts = (RESEARCHER_BACKSTORY, WRITER_BACKSTORY, SOCIAL_BACKSTORY, RESEARCH_TMPL, RESEARCH_BRIEF_PROMPT, CONTENT_TMPL, SOCIAL_TMPL)
+        prompt_hash = hashlib.sha1("\0".join(prompts).encode("utf-8")).hexdigest()[:12]
+        models = "|".join(llm.model for llm in (self.research_llm, self.brief_llm, self.content_llm, self.social_llm))
+        return research_cache_key(topic, f"bulk|{models}|{prompt_hash}")
+
+    def create_content_batch(self, topics, progress_callback=None):
+        """Bulk, non-interactive generation for a list of topics"""
+        return asyncio.run(self.create_content_batch_async(topics, progress_callback))
+
+def serializable_result(result):
+    """create_content result with task outputs as plain strings (for checkpoints and downloads)"""
+    return {key: (value if key in ("success", "social_json", "timings", "error") else str(value)) for key, value in result.items()}
+
+def clear_bulk_checkpoints():
+    """Delete every bulk checkpoint; returns how many were removed"""
+    removed = 0
+    for checkpoint in BULK_CHECKPOINT_DIR.glob("*.json"):
+        checkpoint.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+def parse_topic_list(text):
+    """Topics from pasted text or CSV: first column of each row, blank rows and a 'topic' header skipped"""
+    topics = []
+    for row in csv.reader(io.StringIO(text)):
+        topic = _WHITESPACE_RE.sub(" ", row[0].lstrip("\ufeff")).strip() if row else ""
+        if len(topic) >= 5 and topic.lower() != "topic":
+            topics.append(topic)
+    return topics
+
+def create_bulk_zip(results):
+    """One ZIP with a folder per successfully generated topic"""
+    with tempfile.SpooledTemporaryFile(max_size=1 << 20) as spool:
+        with zipfile.ZipFile(spool, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            for topic, result in results.items():
+                if not result["success"]:
+                    continue
+                folder = _SAFE_CHAR_RE.sub("", topic).rstrip()[:50]
+                zip_file.writestr(f"{folder}/01_research_findings.md", f"# Research Findings: {topic}\n\n{result['research']}")
+                zip_file.writestr(f"{folder}/02_technical_blog_post.md", f"# {topic}\n\n{result['content']}")
+                zip_file.writestr(f"{folder}/03_social_media_content.md", f"# Social Media Content: {topic}\n\n{result['social']}")
+        spool.seek(0)
+        return spool.read()
+
+def stream_events(events, future, status_text):
+    """Yield streamed blog chunks until the run finishes; status messages update the status line"""
+    while not (future.done() and events.empty()):
+        try:
+            kind, payload = events.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if kind == "status":
+            status_text.text(payload)
+        else:
+            yield payload
 
 # ======================
 # Streamlit App
 # ======================
+# Example topics for the selectbox ("" is the unselected option)
+EXAMPLE_TOPIC_OPTIONS = (
+    "",
+    "Advanced RAG Techniques: From Basic Retrieval to Agentic RAG Systems",
+    "Understanding Transformer Architecture Through Implementation",
+    "MLOps Best Practices: From Model Training to Production Deployment",
+    "Vector Databases: The Foundation of Modern AI Applications",
+    "What is Model Context Protocol (MCP)?",
+)
+
+def use_example_topic():
+    """Copy the selected example into the topic text area"""
+    if st.session_state.example:
+        st.session_state.topic = st.session_state.example
+
+# Optional header banner; the app runs without it
+HEADER_IMAGE_PATH = pathlib.Path("forstreamlit.png")
+
+@st.cache_resource
+def get_header_image():
+    """Decode the banner once per server process (the script itself re-runs on every interaction); None if absent"""
+    if not HEADER_IMAGE_PATH.is_file():
+        return None
+    from PIL import Image
+    
+    with Image.open(HEADER_IMAGE_PATH) as header_image:
+        return header_image.copy()
+
 def main():
     st.set_page_config(
         page_title="AI Content Creator",
@@ -466,6 +1084,9 @@ def main():
     
     # Header using standard Streamlit components
     st.title("🤖 AI-Powered Multi-Agent Content Creator")
+    header_image = get_header_image()
+    if header_image is not None:
+        st.image(header_image, use_container_width=True)
     st.markdown("**Transform single prompts into comprehensive, research-backed content packages**")
     st.markdown("---")
     
@@ -488,13 +1109,13 @@ def main():
     # Agent Information
     st.sidebar.header("🤖 Agent Architecture")
     st.sidebar.markdown("""
-    **Research Agent**: Qwen/Qwen3-32B  
+    **Research Agent**: Llama 3.1 8B Instant  
     *Academic research & data gathering*
     
-    **Content Writer**: DeepSeek R1 70B  
+    **Content Writer**: Llama 3.3 70B Versatile  
     *Technical blog post creation*
     
-    **Social Specialist**: DeepSeek R1 70B  
+    **Social Specialist**: Llama 3.3 70B Versatile  
     *Social media content adaptation*
     """)
     
@@ -504,30 +1125,21 @@ def main():
     with col1:
         st.header("📝 Content Creation")
         
-        # Topic input
+        # Topic input, bound to session_state so a chosen example survives the rerun
         topic = st.text_area(
             "What do you want to write about?",
             placeholder="Enter your topic here... (e.g., 'Advanced RAG Techniques: From Basic Retrieval to Agentic RAG Systems')",
-            height=100
+            height=100,
+            key="topic"
         )
         
-        # Example topics
+        # Example topics: the callback fills the text area before the rerun Streamlit already does
+        # for the selectbox change, so no extra st.rerun() cycle is needed
         st.markdown("**🎯 Example Topics:**")
-        example_topics = [
-            "Advanced RAG Techniques: From Basic Retrieval to Agentic RAG Systems",
-            "Understanding Transformer Architecture Through Implementation",
-            "MLOps Best Practices: From Model Training to Production Deployment",
-            "Vector Databases: The Foundation of Modern AI Applications",
-            "What is Model Context Protocol (MCP)?"
-        ]
-        
-        selected_example = st.selectbox("Or choose an example:", [""] + example_topics)
-        if selected_example:
-            topic = selected_example
-            st.rerun()
+        st.selectbox("Or choose an example:", EXAMPLE_TOPIC_OPTIONS, key="example", on_change=use_example_topic)
         
-        # Create content button
-        if st.button("🚀 Create Content", type="primary", disabled=not (groq_api_key and serper_api_key and topic)):
+        # Create content button; always enabled so a click explains what is missing
+        if st.button("🚀 Create Content", type="primary"):
             if not groq_api_key:
                 st.error("Please enter your Groq API key")
             elif not serper_api_key:
@@ -535,26 +1147,43 @@ def main():
             elif not topic or len(topic.strip()) < 5:
                 st.error("Please enter a topic (minimum 5 characters)")
             else:
+                # Collapse whitespace runs (pasted prompts) before the topic reaches prompts and filenames
+                topic = _WHITESPACE_RE.sub(" ", topic).strip()
+                
                 # Create progress bar
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
+                # The crew runs in a worker thread; status messages and blog chunks come back
+                # through one queue and are rendered here, on the script thread
+                events = queue.Queue()
+                
                 def update_progress(message):
-                    status_text.text(message)
+                    events.put(("status", message))
                 
                 # Initialize creator and run
                 try:
-                    creator = StreamlitMultiAgentContentCreator(groq_api_key, serper_api_key)
+                    # Reuse the creator (LLMs, tools, agents) across reruns until the keys change
+                    creds = (groq_api_key, serper_api_key)
+                    if st.session_state.get("creator_creds") != creds:
+                        st.session_state.creator = StreamlitMultiAgentContentCreator(groq_api_key, serper_api_key)
+                        st.session_state.creator_creds = creds
+                    creator = st.session_state.creator
                     
                     progress_bar.progress(25)
-                    update_progress("🔬 Research Agent gathering information...")
+                    status_text.text("🔬 Research Agent gathering information...")
                     
-                    result = creator.create_content(topic, update_progress)
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        future = executor.submit(creator.create_content, topic, update_progress, events)
+                        with st.expander("📝 Live blog draft", expanded=True):
+                            st.write_stream(stream_events(events, future, status_text))
+                        result = future.result()
                     
                     progress_bar.progress(100)
                     
                     if result["success"]:
                         st.success("✅ Content creation completed!")
+                        st.caption("⏱️ " + " · ".join(f"{phase} {seconds:.1f}s" for phase, seconds in result["timings"].items()))
                         
                         # Display results in tabs
                         tab1, tab2, tab3, tab4 = st.tabs(["📊 Research", "📝 Blog Post", "📱 Social Media", "📦 Download"])
@@ -570,13 +1199,16 @@ def main():
                         with tab3:
                             st.header("📱 Social Media Content")
                             st.markdown(str(result["social"]))
+                            if result["social_json"]:
+                                with st.expander("🧾 Structured JSON"):
+                                    st.json(result["social_json"])
                         
                         with tab4:
                             st.header("📦 Download Content")
                             
                             # Create downloadable files
                             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+                            safe_topic = _SAFE_CHAR_RE.sub("", topic).rstrip()[:50]
                             
                             # Create zip file with all content
                             zip_buffer = create_download_zip(topic, result, timestamp, safe_topic)
@@ -618,17 +1250,63 @@ def main():
                     st.error(f"❌ Unexpected error: {str(e)}")
                     st.info("💡 Please check your API keys and internet connection.")
     
+        # Bulk mode: many topics in one non-interactive run
+        with st.expander("📚 Bulk mode"):
+            st.markdown("One topic per line, or upload a CSV with topics in the first column. Finished topics are checkpointed for 7 days (per model and prompt set), so re-running after an interruption resumes where it stopped.")
+            bulk_text = st.text_area("Topics", height=150, key="bulk_topics")
+            bulk_csv = st.file_uploader("Or upload a CSV", type=["csv"])
+            bulk_topics = parse_topic_list(bulk_text)
+            if bulk_csv:
+                try:
+                    bulk_topics = parse_topic_list(bulk_csv.getvalue().decode("utf-8-sig"))  # -sig: Excel's BOM
+                except UnicodeDecodeError:
+                    st.error("❌ The CSV is not UTF-8 encoded. Re-save it as 'CSV UTF-8' and upload it again.")
+                    bulk_topics = []
+            
+            if st.button(f"🚀 Create {len(bulk_topics)} Packages", disabled=not (groq_api_key and serper_api_key and bulk_topics)):
+                bulk_progress = st.progress(0)
+                bulk_status = st.empty()
+                
+                def update_bulk_progress(done, total, finished_topic):
+                    bulk_progress.progress(done / total)
+                    bulk_status.text(f"✅ {done}/{total} done (last: {finished_topic})")
+                
+                try:
+                    creds = (groq_api_key, serper_api_key)
+                    if st.session_state.get("creator_creds") != creds:
+                        st.session_state.creator = StreamlitMultiAgentContentCreator(groq_api_key, serper_api_key)
+                        st.session_state.creator_creds = creds
+                    
+                    bulk_results = st.session_state.creator.create_content_batch(bulk_topics, update_bulk_progress)
+                    failed = [topic for topic, result in bulk_results.items() if not result["success"]]
+                    
+                    st.success(f"✅ {len(bulk_results) - len(failed)}/{len(bulk_results)} packages created")
+                    for topic in failed:
+                        st.error(f"❌ {topic}: {bulk_results[topic]['error']}")
+                    
+                    st.download_button(
+                        label="📥 Download All Packages (ZIP)",
+                        data=create_bulk_zip(bulk_results),
+                        file_name=f"bulk_content_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                        mime="application/zip"
+                    )
+                except Exception as e:
+                    st.error(f"❌ Unexpected error: {str(e)}")
+            
+            if st.button("🗑️ Clear Checkpoints", help="Regenerate every topic on the next bulk run"):
+                st.info(f"Removed {clear_bulk_checkpoints()} checkpoints")
+    
     with col2:
         st.header("ℹ️ How It Works")
         st.markdown("""
         **1. Research Phase**  
-        🔬 Research Agent uses Qwen/Qwen3-32B to gather academic papers, industry data, and technical examples
+        🔬 Research Agent uses Llama 3.1 8B Instant to gather academic papers, industry data, and technical examples
         
         **2. Content Creation**  
-        ✍️ Content Writer uses DeepSeek R1 to create comprehensive blog posts with practical insights
+        ✍️ Content Writer uses Llama 3.3 70B Versatile to create comprehensive blog posts with practical insights
         
         **3. Social Adaptation**  
-        📱 Social Specialist uses DeepSeek R1 to create engaging social media content
+        📱 Social Specialist uses Llama 3.3 70B to create engaging social media content
         
         **4. Output Generation**  
         📦 All content is packaged and ready for download
@@ -654,66 +1332,63 @@ def main():
 
 def create_download_zip(topic, result, timestamp, safe_topic):
     """Create a ZIP file with all content"""
-    import io
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    header_suffix = f": {topic}\n\n*Generated: {generated}*\n\n"  # shared tail of every section header
+    research = str(result['research']).encode("utf-8")
+    content = str(result['content']).encode("utf-8")
+    social = str(result['social']).encode("utf-8")
     
-    zip_buffer = io.BytesIO()
+    def write_member(zip_file, name, *chunks):
+        # Stream the pieces into the member instead of concatenating them into one string first
+        with zip_file.open(name, "w") as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Research findings
-        zip_file.writestr(
-            f"01_research_findings.md",
-            f"# Research Findings: {topic}\n\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n{str(result['research'])}"
-        )
-        
-        # Blog post
-        zip_file.writestr(
-            f"02_technical_blog_post.md",
-            f"# {topic}\n\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n{str(result['content'])}"
-        )
-        
-        # Social media
-        zip_file.writestr(
-            f"03_social_media_content.md",
-            f"# Social Media Content: {topic}\n\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n{str(result['social'])}"
-        )
-        
-        # Complete package
-        zip_file.writestr(
-            f"complete_content_package.md",
-            f"""# Complete Multi-Agent Content Package: {topic}
+    # Spools in memory up to 1 MiB, then moves to a temp file
+    with tempfile.SpooledTemporaryFile(max_size=1 << 20) as spool:
+        # compresslevel=1: markdown still compresses well, at a fraction of the CPU time
+        with zipfile.ZipFile(spool, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            # Research findings
+            write_member(zip_file, "01_research_findings.md", "# Research Findings" + header_suffix, research)
+            
+            # Blog post
+            write_member(zip_file, "02_technical_blog_post.md", f"# {topic}\n\n*Generated: {generated}*\n\n", content)
+            
+            # Social media
+            write_member(zip_file, "03_social_media_content.md", "# Social Media Content" + header_suffix, social)
+            
+            # Complete package
+            write_member(
+                zip_file,
+                "complete_content_package.md",
+                f"""# Complete Multi-Agent Content Package: {topic}
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {generated}
 **Architecture:** Multi-Agent System
-**Research Model:** Qwen/Qwen3-32B
-**Content Model:** DeepSeek R1 Distill Llama 70B
-**Social Model:** DeepSeek R1 Distill Llama 70B
+**Research Model:** Llama 3.1 8B Instant
+**Content Model:** Llama 3.3 70B Versatile
+**Social Model:** Llama 3.3 70B Versatile
 
 ---
 
 # RESEARCH FINDINGS
 
-{str(result['research'])}
-
----
-
-# TECHNICAL BLOG POST
-
-{str(result['content'])}
-
----
-
-# SOCIAL MEDIA CONTENT
-
-{str(result['social'])}
-"""
-        )
-        
-        # README
-        zip_file.writestr(
-            "README.md",
-            f"""# Content Package: {topic}
+""",
+                research,
+                "\n\n---\n\n# TECHNICAL BLOG POST\n\n",
+                content,
+                "\n\n---\n\n# SOCIAL MEDIA CONTENT\n\n",
+                social,
+                "\n"
+            )
+            
+            # README
+            write_member(
+                zip_file,
+                "README.md",
+                f"""# Content Package: {topic}
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {generated}
 
 ## Files:
 - `01_research_findings.md` - Research findings
@@ -725,10 +1400,10 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 AI-Powered Multi-Agent Content Creator
 https://github.com/elandil2/blog-poster
 """
-        )
-    
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+            )
+        
+        spool.seek(0)
+        return spool.read()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
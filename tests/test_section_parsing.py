@@ -0,0 +1,49 @@
+import pytest
+
+CONTENT = (
+    "Intro the model wrote before the first header\n"
+    "# BLOG POST: Advanced RAG Techniques\n"
+    "Blog body\n"
+    "# LINKEDIN POSTS (English + Turkish)\n"
+    "LinkedIn body\n"
+    "# X/TWITTER POSTS — threads\n"
+    "Twitter body\n"
+    "# BLOG POSTS ARE NOT A SECTION\n"
+    "still twitter\n"
+    "# IMAGE CONCEPTS\n"
+    "Image body\n"
+)
+
+
+def test_main_parse_sections_accepts_titled_headers():
+    for module in ("dotenv", "aiofiles", "httpx"):
+        pytest.importorskip(module)
+    import main
+
+    sections = main.parse_sections(CONTENT)
+
+    assert sections == {
+        "blog": "Blog body",
+        "linkedin": "LinkedIn body",
+        "twitter": "Twitter body\n# BLOG POSTS ARE NOT A SECTION\nstill twitter",
+        "images": "Image body",
+    }
+
+
+def test_researcherqwen_find_sections_accepts_titled_headers():
+    for module in ("crewai", "crewai_tools", "dotenv", "aiofiles", "aiohttp", "orjson"):
+        pytest.importorskip(module)
+    import researcherqwen
+
+    content = (
+        "# BLOG POST: Advanced RAG Techniques\nBlog body\n"
+        "# LINKEDIN POSTS (English + Turkish)\nLinkedIn body\n"
+        "# X/TWITTER POSTS — threads\nTwitter body\n"
+        "# MIDJOURNEY PROMPTS\nPrompts\n"
+    ).encode("utf-8")
+
+    sections = researcherqwen.find_sections(content)
+
+    assert list(sections) == ["BLOG POST", "LINKEDIN POSTS", "X/TWITTER POSTS", "MIDJOURNEY PROMPTS"]
+    _, body_start, section_end = sections["BLOG POST"]
+    assert content[body_start:section_end].strip() == b"Blog body"